@@ -3,13 +3,20 @@ import logging
 from homeassistant import config_entries
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.const import CONF_USERNAME, CONF_PASSWORD, CONF_HOST
 from .technicolor_cga import TechnicolorCGA
 from .config_flow import TechnicolorCGAOptionsFlowHandler
+from .const import DATA_SNAPSHOTS
+from .services import async_setup_services, async_unload_services
+from .session import async_login, async_remove_session, forget_login
+from .snapshot import GatewaySnapshot, async_remove_snapshot
+from .websocket_api import async_setup_websocket
 
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "technicolor_cga"
+PLATFORMS = ["sensor", "device_tracker", "binary_sensor"]
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Set up Technicolor CGA from a config entry."""
@@ -20,25 +27,49 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     _LOGGER.info("[TCGA] Setting up integration for router=%s", router)
 
-    try:
-        technicolor_cga = TechnicolorCGA(username, password, router)
-        await hass.async_add_executor_job(technicolor_cga.login)
-        _LOGGER.info("[TCGA] Login successful to router=%s", router)
-    except Exception:
-        _LOGGER.exception("[TCGA] Failed to log in to Technicolor CGA (router=%s)", router)
-        return False
+    technicolor_cga = TechnicolorCGA(
+        username, password, router,
+        max_concurrent=entry.options.get("max_concurrent_requests", 1),
+    )
+
+    # Last known data; the platforms create their entities from it without waiting for the gateway
+    snapshot = GatewaySnapshot(hass, entry.entry_id)
+    await snapshot.async_load()
+
+    if snapshot:
+        # Logged in by the platforms' first background refresh (session.async_ensure_login)
+        _LOGGER.info("[TCGA] Restoring last known data for router=%s; logging in in the background", router)
+    else:
+        # Nothing to show yet: the first setup needs the gateway, HA retries it later if unreachable
+        try:
+            # Reuses the session saved by the previous run when the gateway still accepts it
+            await async_login(hass, entry.entry_id, technicolor_cga)
+            _LOGGER.info("[TCGA] Login successful to router=%s", router)
+        except Exception as err:
+            technicolor_cga.close()
+            raise ConfigEntryNotReady(f"Failed to log in to Technicolor CGA (router={router}): {err}") from err
 
     hass.data[DOMAIN][entry.entry_id] = technicolor_cga
-    _LOGGER.info("[TCGA] Forwarding entry setups for platforms: sensor, device_tracker")
-    await hass.config_entries.async_forward_entry_setups(entry, ["sensor", "device_tracker"])  # Await per HA 2025.1 requirements
+    hass.data.setdefault(DATA_SNAPSHOTS, {})[entry.entry_id] = snapshot
+    await async_setup_services(hass)
+    async_setup_websocket(hass)
+    _LOGGER.info("[TCGA] Forwarding entry setups for platforms: %s", PLATFORMS)
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)  # Await per HA 2025.1 requirements
 
     return True
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, ["sensor", "device_tracker"])
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+        await hass.data[DATA_SNAPSHOTS].pop(entry.entry_id).async_flush()
+        forget_login(entry.entry_id)
+        async_unload_services(hass)
 
     return unload_ok
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Forget the saved gateway session and data snapshot when the entry is deleted."""
+    await async_remove_session(hass, entry.entry_id)
+    await async_remove_snapshot(hass, entry.entry_id)
@@ -0,0 +1,137 @@
+"""Rolling-window anomaly detection on DOCSIS power and SNR readings.
+
+Each channel/metric keeps a fixed-size ring buffer (`array('d')`) with running
+sums, so the moving mean, standard deviation and z-score of a new reading are
+O(1) and a tick costs O(channels). A reading is anomalous when it is more than
+`z_threshold` standard deviations and at least `min_deviation` dB away from
+the window mean; it is added to the window either way, so a lasting change
+becomes the new normal after about one window.
+"""
+
+import math
+from array import array
+from typing import NamedTuple
+
+try:
+    from .docsis import channel_readings
+except ImportError:  # standalone use (exporter.py, test.py)
+    from docsis import channel_readings
+
+MONITORED_METRICS = ("power", "snr")
+
+
+class LevelStats(NamedTuple):
+    direction: str
+    channel_type: str
+    channel: str
+    metric: str
+    value: float
+    mean: float
+    std: float
+    z: float
+
+
+class _Window:
+    """Ring buffer of the last `size` readings with running sum and sum of squares."""
+
+    __slots__ = ("values", "index", "count", "total", "squares", "last_seen")
+
+    def __init__(self, size: int):
+        self.values = array("d", bytes(8 * size))
+        self.index = 0
+        self.count = 0
+        self.total = 0.0
+        self.squares = 0.0
+        self.last_seen = 0
+
+    def mean_std(self):
+        mean = self.total / self.count
+        variance = max(0.0, self.squares / self.count - mean * mean)
+        return mean, math.sqrt(variance)
+
+    def add(self, value: float):
+        size = len(self.values)
+        if self.count == size:
+            old = self.values[self.index]
+            self.total -= old
+            self.squares -= old * old
+        else:
+            self.count += 1
+        self.values[self.index] = value
+        self.total += value
+        self.squares += value * value
+        self.index = (self.index + 1) % size
+        if self.index == 0:
+            # Running sums drift with float error; rebuild them once per wrap
+            filled = self.values[:self.count]
+            self.total = math.fsum(filled)
+            self.squares = math.fsum(v * v for v in filled)
+
+
+class LevelMonitor:
+    """Learn normal power/SNR per channel and flag readings outside those bounds.
+
+    `min_samples` readings are learned before a channel can be flagged and the
+    standard deviation is floored at `min_std`, so perfectly stable channels do
+    not alarm on the first 0.1 dB step. Channels missing from `levels()` for a
+    whole window are forgotten.
+    """
+
+    def __init__(self, window=60, z_threshold=4.0, min_samples=10, min_deviation=1.5, min_std=0.25, metrics=MONITORED_METRICS):
+        self.window = window
+        self.z_threshold = z_threshold
+        self.min_samples = min_samples
+        self.min_deviation = min_deviation
+        self.min_std = min_std
+        self.metrics = metrics
+
+        self.ticks = 0
+        # (direction, channel_type, channel, metric) -> LevelStats of the last reading
+        self.latest: dict[tuple, LevelStats] = {}
+        self.anomalies: dict[tuple, LevelStats] = {}
+        self._windows: dict[tuple, _Window] = {}
+
+    def update(self, levels: dict) -> list[LevelStats]:
+        """Feed one levels() reply; returns the readings that just became anomalous."""
+        self.ticks += 1
+        started = []
+        for reading in channel_readings(levels):
+            if reading.metric not in self.metrics:
+                continue
+            key = reading[:4]
+            window = self._windows.get(key)
+            if window is None:
+                window = self._windows[key] = _Window(self.window)
+            window.last_seen = self.ticks
+
+            if window.count:
+                mean, std = window.mean_std()
+            else:
+                mean, std = reading.value, 0.0
+            deviation = reading.value - mean
+            z = deviation / max(std, self.min_std)
+            stats = LevelStats(*key, reading.value, round(mean, 2), round(std, 3), round(z, 2))
+            self.latest[key] = stats
+
+            anomalous = (
+                window.count >= self.min_samples
+                and abs(z) >= self.z_threshold
+                and abs(deviation) >= self.min_deviation
+            )
+            if anomalous:
+                if key not in self.anomalies:
+                    started.append(stats)
+                self.anomalies[key] = stats
+            else:
+                self.anomalies.pop(key, None)
+            window.add(reading.value)
+
+        for key in [k for k, w in self._windows.items() if self.ticks - w.last_seen >= self.window]:
+            del self._windows[key]
+            self.latest.pop(key, None)
+            self.anomalies.pop(key, None)
+        return started
+
+    @property
+    def channels(self) -> int:
+        return len(self._windows)
@@ -0,0 +1,110 @@
+import logging
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntity
+from homeassistant.const import CONF_HOST
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .anomaly import LevelMonitor
+from .const import DOMAIN, EVENT_DOCSIS_ANOMALY, SIGNAL_LEVELS_UPDATED
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(hass, config_entry, async_add_entities):
+    """Set up the Technicolor CGA DOCSIS anomaly sensor from a config entry."""
+    technicolor_cga = hass.data[DOMAIN].get(config_entry.entry_id)
+    if technicolor_cga is None:
+        _LOGGER.error("Technicolor CGA instance not found in hass.data for entry %s", config_entry.entry_id)
+        return
+
+    host = config_entry.data[CONF_HOST]
+
+    # The modem levels are fetched in the sensor platform's batched tick and
+    # delivered through SIGNAL_LEVELS_UPDATED; this platform sends no requests.
+    async_add_entities([
+        TechnicolorCGADocsisAnomalySensor(
+            technicolor_cga,
+            hass,
+            config_entry.entry_id,
+            host,
+            "Technicolor CGA DOCSIS Anomaly",
+            LevelMonitor(),
+        )
+    ])
+
+
+class TechnicolorCGADocsisAnomalySensor(BinarySensorEntity):
+    """On while any DOCSIS channel's power or SNR is outside its learned range."""
+
+    endpoint = "levels"
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    # Only the sensor platform's tick feeds the monitor, so samples are one per scan interval
+    _attr_should_poll = False
+
+    def __init__(self, technicolor_cga, hass, config_entry_id, host, name, monitor: LevelMonitor):
+        self.technicolor_cga = technicolor_cga
+        self.hass = hass
+        self._config_entry_id = config_entry_id
+        self._host = host
+        self._attr_name = name
+        self._monitor = monitor
+        self._attr_available = True
+
+    async def async_added_to_hass(self):
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_LEVELS_UPDATED.format(self._config_entry_id), self._handle_levels
+            )
+        )
+
+    @callback
+    def _handle_levels(self, result):
+        self.apply_result(result)
+        self.async_write_ha_state()
+
+    @property
+    def unique_id(self):
+        """Return a unique ID."""
+        return f"{self._config_entry_id}_{self._attr_name.replace(' ', '_').lower()}"
+
+    @property
+    def is_on(self):
+        return bool(self._monitor.anomalies)
+
+    @property
+    def extra_state_attributes(self):
+        return {
+            "channels": self._monitor.channels,
+            "samples": self._monitor.ticks,
+            "anomalies": [stats._asdict() for stats in self._monitor.anomalies.values()],
+        }
+
+    @property
+    def device_info(self):
+        """Match device registry info used by the sensors."""
+        return {
+            "identifiers": {(DOMAIN, self._host)},
+            "name": "Technicolor CGA Gateway",
+            "manufacturer": "Technicolor",
+            "configuration_url": f"http://{self._host}/",
+        }
+
+    def apply_result(self, result):
+        """Feed a levels FetchResult into the monitor and fire events for new anomalies."""
+        if not result.ok:
+            # Logged once per tick by the sensor platform, which fetched it
+            self._attr_available = False
+            _LOGGER.debug(f"{self.name} unavailable: {result.error}")
+            return
+        for stats in self._monitor.update(result.data):
+            _LOGGER.warning(
+                "[TCGA][DOCSIS] %s %s channel %s %s %.1f outside learned range (mean %.1f, z %.1f)",
+                stats.direction, stats.channel_type, stats.channel, stats.metric, stats.value, stats.mean, stats.z,
+            )
+            self.hass.bus.async_fire(EVENT_DOCSIS_ANOMALY, {
+                "config_entry_id": self._config_entry_id,
+                "host": self._host,
+                **stats._asdict(),
+            })
+        self._attr_available = True
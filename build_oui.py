@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Rebuild the bundled MAC vendor index (oui.bin.gz) from the IEEE MA-L registry.
+
+Usage:
+  curl -O https://standards-oui.ieee.org/oui/oui.csv
+  python3 build_oui.py oui.csv [--output oui.bin.gz]
+
+See oui.py for the file layout.
+"""
+
+import argparse
+import csv
+import gzip
+import struct
+import sys
+from array import array
+
+from oui import DATA_FILE, HEADER, MAGIC
+
+
+def _clean(name: str) -> str:
+    return " ".join(name.split())
+
+
+def build(rows) -> bytes:
+    """Packed index from (hex OUI, vendor name) pairs."""
+    entries = {}
+    for assignment, name in rows:
+        assignment = assignment.strip().replace("-", "").replace(":", "")
+        name = _clean(name)
+        if len(assignment) != 6 or not name:
+            continue
+        entries[int(assignment, 16)] = name
+
+    keys = array("I")
+    vendor_ids = array("H")
+    vendor_index: dict[str, int] = {}
+    for key in sorted(entries):
+        name = entries[key]
+        keys.append(key)
+        vendor_ids.append(vendor_index.setdefault(name, len(vendor_index)))
+    if len(vendor_index) > 0xFFFF:
+        raise ValueError("too many distinct vendors for uint16 ids")
+
+    offsets = array("I", [0])
+    names = bytearray()
+    for name in vendor_index:  # insertion order == id order
+        names += name.encode("utf-8")
+        offsets.append(len(names))
+
+    if sys.byteorder == "big":
+        for values in (keys, vendor_ids, offsets):
+            values.byteswap()
+    return HEADER.pack(MAGIC, len(keys), len(vendor_index)) + keys.tobytes() + vendor_ids.tobytes() + offsets.tobytes() + bytes(names)
+
+
+def _read_csv(path: str):
+    with open(path, newline="", encoding="utf-8") as fh:
+        for row in csv.DictReader(fh):
+            if row.get("Registry", "MA-L") == "MA-L":
+                yield row["Assignment"], row["Organization Name"]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the bundled OUI vendor index")
+    parser.add_argument("csv", help="IEEE MA-L registry in CSV form (oui.csv)")
+    parser.add_argument("--output", default=DATA_FILE, help="Index file to write (default: oui.bin.gz next to oui.py)")
+    args = parser.parse_args()
+
+    blob = build(_read_csv(args.csv))
+    count, vendors = struct.unpack_from("<II", blob, 4)
+    # mtime=0 keeps rebuilds of the same registry byte-identical
+    with open(args.output, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=9, mtime=0) as fh:
+        fh.write(blob)
+    print(f"Wrote {args.output}: {count} OUIs, {vendors} vendors, {len(blob)} bytes uncompressed")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,173 @@
+"""Traffic capture and replay for the Technicolor CGA client.
+
+CaptureRecorder appends every request/response pair seen by a requests.Session
+to a JSONL file (gzip-compressed when the path ends in ".gz"), with credentials
+redacted. ReplayAdapter serves such a capture back to a session without any
+network access, so the integration can be exercised offline against real
+host tables and modem levels.
+"""
+
+import gzip
+import json
+import threading
+import time
+from collections import deque
+from datetime import timedelta
+from urllib.parse import parse_qsl, urlsplit, urlencode
+
+from requests.adapters import BaseAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+CAPTURE_VERSION = 1
+REDACTED = "REDACTED"
+
+# Form fields posted by login(); "seeksalthash" is a protocol marker, not a secret
+_SECRET_FIELDS = ("username", "password")
+_PUBLIC_VALUES = ("seeksalthash",)
+
+
+def _open(path: str, mode: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _request_key(method: str, url: str) -> str:
+    """Method and path with the "_=<timestamp>" cache buster dropped."""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != "_"]
+    path = parts.path
+    if query:
+        path = f"{path}?{urlencode(query)}"
+    return f"{method.upper()} {path}"
+
+
+def _match_key(key: str) -> str:
+    """Request key with the comma-separated field list in the path as a sorted set.
+
+    Field order and duplicates do not change the gateway's reply, so captures
+    keep matching when the client's field lists are reordered or de-duplicated.
+    """
+    method, _, target = key.partition(" ")
+    path, sep, query = target.partition("?")
+    head, slash, fields = path.rpartition("/")
+    if "," in fields:
+        path = f"{head}{slash}{','.join(sorted(set(fields.split(','))))}"
+    return f"{method} {path}{sep}{query}"
+
+
+def _redact_form(body) -> dict | None:
+    if not body:
+        return None
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", "replace")
+    form = {}
+    for key, value in parse_qsl(str(body), keep_blank_values=True):
+        if key in _SECRET_FIELDS and value not in _PUBLIC_VALUES:
+            value = REDACTED
+        form[key] = value
+    return form
+
+
+class CaptureRecorder:
+    """Append request/response pairs to a capture file (thread-safe)."""
+
+    def __init__(self, path: str, server: str | None = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._file = _open(path, "a")
+        self._write({"capture": CAPTURE_VERSION, "server": server, "started": time.time()})
+
+    def _write(self, record: dict):
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+            self._file.flush()
+
+    def record(self, response, *args, **kwargs):
+        """requests response hook."""
+        request = response.request
+        self._write({
+            "t": round(time.monotonic() - self._started, 3),
+            "key": _request_key(request.method, request.url),
+            "form": _redact_form(request.body),
+            "status": response.status_code,
+            "elapsed": round(response.elapsed.total_seconds(), 4) if response.elapsed else 0.0,
+            # Cookie values are session credentials; keep only the names
+            "cookies": sorted(response.cookies.keys()),
+            "body": response.text,
+        })
+        return response
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class ReplayAdapter(BaseAdapter):
+    """Transport adapter answering requests from a capture file.
+
+    Responses are matched by method, path and the set of requested fields
+    (order and duplicates ignored) and served in recorded order,
+    looping once a key's recordings are used up. With speed=1.0 the recorded
+    latency is reproduced, larger values replay faster and 0 disables delays.
+    """
+
+    def __init__(self, path: str, cookies, speed: float = 1.0):
+        super().__init__()
+        self.speed = speed
+        self._cookies = cookies
+        self._lock = threading.Lock()
+        self._recorded: dict[str, list[dict]] = {}
+        self._pending: dict[str, deque] = {}
+        with _open(path, "r") as fh:
+            for line in fh:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                if "key" not in record:
+                    continue  # header line
+                self._recorded.setdefault(_match_key(record["key"]), []).append(record)
+
+    def _next(self, key: str) -> dict | None:
+        with self._lock:
+            recorded = self._recorded.get(key)
+            if not recorded:
+                return None
+            pending = self._pending.get(key)
+            if not pending:
+                pending = self._pending[key] = deque(recorded)
+            return pending.popleft()
+
+    def send(self, request, **kwargs):
+        record = self._next(_match_key(_request_key(request.method, request.url)))
+        if record is None:
+            status, body, elapsed, cookies = 404, '{"error":"not captured"}', 0.0, []
+        else:
+            status, body, elapsed, cookies = record["status"], record["body"], record["elapsed"], record["cookies"]
+
+        if self.speed and elapsed:
+            time.sleep(elapsed / self.speed)
+
+        for name in cookies:
+            self._cookies.set(name, f"replay-{name}")
+
+        response = Response()
+        response.status_code = status
+        response._content = body.encode("utf-8")
+        response.encoding = "utf-8"
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(seconds=elapsed)
+        response.connection = self
+        return response
+
+    def close(self):
+        pass
@@ -2,6 +2,7 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_USERNAME, CONF_PASSWORD, CONF_HOST
 from .const import DOMAIN
+from .matcher import normalize_ip_rule, normalize_mac_rule
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Technicolor CGA."""
@@ -37,94 +38,96 @@ class TechnicolorCGAOptionsFlowHandler(config_entries.OptionsFlow):
         self.config_entry = config_entry
 
     def _normalize_mac(self, mac: str) -> str:
-        mac = (mac or "").strip().lower().replace("-", ":")
-        # zero-pad segments
-        parts = [p.zfill(2) for p in mac.split(":") if p]
-        return ":".join(parts)
+        # MACs or prefixes like "aa:bb:cc:*"; raises ValueError if invalid
+        return normalize_mac_rule(mac)
 
     def _normalize_ip(self, ip: str) -> str:
-        return (ip or "").strip()
+        # IPs or CIDR networks like "192.168.50.0/24"; raises ValueError if invalid
+        return normalize_ip_rule(ip)
 
-    def _parse_disabled_macs(self, text: str) -> list[str]:
+    def _parse_list(self, text: str, normalize, invalid: list[str]) -> list[str]:
         items = []
         for raw in (text or "").replace("\n", ",").split(","):
             val = raw.strip()
             if not val:
                 continue
-            items.append(self._normalize_mac(val))
+            try:
+                items.append(normalize(val))
+            except ValueError:
+                invalid.append(val)
         return sorted(set(items))
 
-    def _parse_disabled_ips(self, text: str) -> list[str]:
-        items = []
-        for raw in (text or "").replace("\n", ",").split(","):
-            val = raw.strip()
-            if not val:
-                continue
-            items.append(self._normalize_ip(val))
-        return sorted(set(items))
+    def _parse_disabled_macs(self, text: str, invalid: list[str]) -> list[str]:
+        return self._parse_list(text, self._normalize_mac, invalid)
 
-    def _parse_name_overrides_mac(self, text: str) -> dict[str, str]:
-        mapping: dict[str, str] = {}
-        for line in (text or "").splitlines():
-            if not line.strip():
-                continue
-            if "=" in line:
-                mac, name = line.split("=", 1)
-            elif ":" in line:
-                # allow mac: name
-                mac, name = line.split(":", 1)
-            else:
-                # ignore invalid line
-                continue
-            mac = self._normalize_mac(mac)
-            name = name.strip()
-            if mac and name:
-                mapping[mac] = name
-        return mapping
+    def _parse_disabled_ips(self, text: str, invalid: list[str]) -> list[str]:
+        return self._parse_list(text, self._normalize_ip, invalid)
 
-    def _parse_name_overrides_ip(self, text: str) -> dict[str, str]:
+    def _parse_mapping(self, text: str, normalize, invalid: list[str], colon_separator: bool = False) -> dict[str, str]:
         mapping: dict[str, str] = {}
         for line in (text or "").splitlines():
             if not line.strip():
                 continue
             if "=" in line:
-                ip, name = line.split("=", 1)
-            elif ":" in line:
-                ip, name = line.split(":", 1)
+                key, name = line.split("=", 1)
+            elif ": " in line:
+                # allow "key: name"; MACs contain ":" themselves, so split on ": "
+                key, name = line.split(": ", 1)
+            elif colon_separator and ":" in line:
+                # "192.168.0.20:Laptop", accepted before ": " was required
+                key, name = line.split(":", 1)
             else:
+                invalid.append(line.strip())
                 continue
-            ip = self._normalize_ip(ip)
             name = name.strip()
-            if ip and name:
-                mapping[ip] = name
+            try:
+                key = normalize(key)
+            except ValueError:
+                invalid.append(line.strip())
+                continue
+            if name:
+                mapping[key] = name
         return mapping
 
+    def _parse_name_overrides_mac(self, text: str, invalid: list[str]) -> dict[str, str]:
+        return self._parse_mapping(text, self._normalize_mac, invalid)
+
+    def _parse_name_overrides_ip(self, text: str, invalid: list[str]) -> dict[str, str]:
+        return self._parse_mapping(text, self._normalize_ip, invalid, colon_separator=True)
+
     async def async_step_init(self, user_input=None):
+        errors: dict[str, str] = {}
+        invalid: dict[str, list[str]] = {}
         if user_input is not None:
             # Validate values
             scan = int(user_input.get("scan_interval", 300))
             if scan < 10:
                 scan = 10
-            disabled_macs_text = user_input.get("disabled_macs", "")
-            names_macs_text = user_input.get("name_overrides", "")
-            disabled_ips_text = user_input.get("disabled_ips", "")
-            names_ips_text = user_input.get("name_overrides_ip", "")
-            disabled_macs = self._parse_disabled_macs(disabled_macs_text)
-            names_macs = self._parse_name_overrides_mac(names_macs_text)
-            disabled_ips = self._parse_disabled_ips(disabled_ips_text)
-            names_ips = self._parse_name_overrides_ip(names_ips_text)
-            return self.async_create_entry(
-                title="Options",
-                data={
-                    "scan_interval": scan,
-                    "disabled_macs": disabled_macs,
-                    "name_overrides": names_macs,
-                    "disabled_ips": disabled_ips,
-                    "name_overrides_ip": names_ips,
-                },
-            )
+            max_concurrent = max(1, int(user_input.get("max_concurrent_requests", 1)))
+            for field in ("disabled_macs", "name_overrides", "disabled_ips", "name_overrides_ip"):
+                invalid[field] = []
+            disabled_macs = self._parse_disabled_macs(user_input.get("disabled_macs", ""), invalid["disabled_macs"])
+            names_macs = self._parse_name_overrides_mac(user_input.get("name_overrides", ""), invalid["name_overrides"])
+            disabled_ips = self._parse_disabled_ips(user_input.get("disabled_ips", ""), invalid["disabled_ips"])
+            names_ips = self._parse_name_overrides_ip(user_input.get("name_overrides_ip", ""), invalid["name_overrides_ip"])
+            for field, bad in invalid.items():
+                if bad:
+                    errors[field] = "invalid_mac_rule" if field in ("disabled_macs", "name_overrides") else "invalid_ip_rule"
+            if not errors:
+                return self.async_create_entry(
+                    title="Options",
+                    data={
+                        "scan_interval": scan,
+                        "max_concurrent_requests": max_concurrent,
+                        "disabled_macs": disabled_macs,
+                        "name_overrides": names_macs,
+                        "disabled_ips": disabled_ips,
+                        "name_overrides_ip": names_ips,
+                    },
+                )
 
         current_scan = self.config_entry.options.get("scan_interval", 300)
+        current_max_concurrent = self.config_entry.options.get("max_concurrent_requests", 1)
         current_disabled_macs = ", ".join(self.config_entry.options.get("disabled_macs", []))
         current_names_map_macs: dict = self.config_entry.options.get("name_overrides", {})
         current_names_macs = "\n".join(f"{mac} = {name}" for mac, name in current_names_map_macs.items())
@@ -133,12 +136,21 @@ class TechnicolorCGAOptionsFlowHandler(config_entries.OptionsFlow):
         current_names_map_ips: dict = self.config_entry.options.get("name_overrides_ip", {})
         current_names_ips = "\n".join(f"{ip} = {name}" for ip, name in current_names_map_ips.items())
 
+        if user_input is not None:
+            # Keep what was typed so invalid entries can be corrected
+            current_scan = user_input.get("scan_interval", current_scan)
+            current_max_concurrent = user_input.get("max_concurrent_requests", current_max_concurrent)
+            current_disabled_ips = user_input.get("disabled_ips", current_disabled_ips)
+            current_names_ips = user_input.get("name_overrides_ip", current_names_ips)
+            current_disabled_macs = user_input.get("disabled_macs", current_disabled_macs)
+            current_names_macs = user_input.get("name_overrides", current_names_macs)
+
         schema = vol.Schema({
             vol.Required("scan_interval", default=current_scan): int,
+            vol.Required("max_concurrent_requests", default=current_max_concurrent): int,
             vol.Optional("disabled_ips", default=current_disabled_ips): str,
             vol.Optional("name_overrides_ip", default=current_names_ips): str,
             vol.Optional("disabled_macs", default=current_disabled_macs): str,
             vol.Optional("name_overrides", default=current_names_macs): str,
         })
-        return self.async_show_form(step_id="init", data_schema=schema)
-
+        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
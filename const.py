@@ -2,3 +2,49 @@ from homeassistant.const import CONF_USERNAME, CONF_PASSWORD, CONF_HOST
 
 DOMAIN = "technicolor_cga"
 
+SERVICE_REBOOT = "reboot"
+SERVICE_PROFILE = "profile"
+ATTR_DURATION = "duration"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+
+# Dispatcher signal sent (formatted with the entry id) when polling may resume after a reboot
+SIGNAL_GATEWAY_RESUMED = f"{DOMAIN}_gateway_resumed_{{}}"
+# Dispatcher signal carrying the modem levels FetchResult of each sensor platform tick
+SIGNAL_LEVELS_UPDATED = f"{DOMAIN}_levels_updated_{{}}"
+
+# Reboot watcher: wait for the gateway to go down, then probe with exponential spacing
+REBOOT_DOWN_PROBE_SECONDS = 2
+REBOOT_DOWN_TIMEOUT_SECONDS = 180
+REBOOT_PROBE_INITIAL_SECONDS = 5
+REBOOT_PROBE_MAX_SECONDS = 60
+REBOOT_TIMEOUT_SECONDS = 900
+
+# Events fired once per tick from the diff of consecutive hostTbl snapshots
+EVENT_DEVICE_JOINED = f"{DOMAIN}_device_joined"
+EVENT_DEVICE_LEFT = f"{DOMAIN}_device_left"
+EVENT_DEVICE_IP_CHANGED = f"{DOMAIN}_device_ip_changed"
+EVENT_DEVICE_HOSTNAME_CHANGED = f"{DOMAIN}_device_hostname_changed"
+
+# Private (owner-only) storage of the gateway session, formatted with the entry id
+STORAGE_VERSION = 1
+STORAGE_KEY_SESSION = f"{DOMAIN}.session.{{}}"
+# Last known host/system/DHCP data (snapshot.GatewaySnapshot), restored at startup
+STORAGE_KEY_SNAPSHOT = f"{DOMAIN}.snapshot.{{}}"
+SNAPSHOT_SAVE_DELAY = 300
+
+# Fired when a DOCSIS channel's power or SNR leaves its learned range
+EVENT_DOCSIS_ANOMALY = f"{DOMAIN}_docsis_anomaly"
+
+# hass.data key of the host table coordinators, by entry id (the client lives in hass.data[DOMAIN])
+DATA_COORDINATORS = f"{DOMAIN}_coordinators"
+# Query-ready copy of the latest host table (hosts.HostTable), by entry id
+DATA_HOST_TABLES = f"{DOMAIN}_host_tables"
+# snapshot.GatewaySnapshot, by entry id
+DATA_SNAPSHOTS = f"{DOMAIN}_snapshots"
+
+# Profiling service: default and maximum time box in seconds
+PROFILE_DEFAULT_SECONDS = 60
+PROFILE_MAX_SECONDS = 600
+
+WS_TYPE_HOSTS = f"{DOMAIN}/hosts"
+WS_MAX_LIMIT = 500
@@ -5,14 +5,41 @@ from typing import Dict, List
 from homeassistant.components.device_tracker import TrackerEntity
 from homeassistant.components.device_tracker.const import SourceType
 from homeassistant.const import CONF_HOST, STATE_HOME, STATE_NOT_HOME
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, CoordinatorEntity, UpdateFailed
-
-from .const import DOMAIN
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+
+from . import hosts, oui
+from .const import (
+    DATA_COORDINATORS,
+    DATA_HOST_TABLES,
+    DATA_SNAPSHOTS,
+    DOMAIN,
+    EVENT_DEVICE_HOSTNAME_CHANGED,
+    EVENT_DEVICE_IP_CHANGED,
+    EVENT_DEVICE_JOINED,
+    EVENT_DEVICE_LEFT,
+    SIGNAL_GATEWAY_RESUMED,
+)
+from .matcher import IPRuleSet, MACRuleSet, normalize_ip_rule, normalize_mac_rule
+from .session import async_ensure_login
+from .technicolor_cga import CircuitOpenError
 
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_SCAN_SECONDS = 60
 
+HOST_CHANGE_EVENTS = {
+    hosts.JOINED: EVENT_DEVICE_JOINED,
+    hosts.LEFT: EVENT_DEVICE_LEFT,
+    hosts.IP_CHANGED: EVENT_DEVICE_IP_CHANGED,
+    hosts.HOSTNAME_CHANGED: EVENT_DEVICE_HOSTNAME_CHANGED,
+}
+
 
 def _normalize_mac(mac: str) -> str:
     mac = (mac or "").strip().lower().replace("-", ":")
@@ -24,6 +51,19 @@ def _normalize_ip(ip: str) -> str:
     ip = (ip or "").strip()
     return ip
 
+def _compile_rules(rule_set_cls, rules: dict):
+    """Compile option rules, dropping (and logging) entries that do not parse."""
+    normalize = normalize_ip_rule if rule_set_cls is IPRuleSet else normalize_mac_rule
+    valid = {}
+    for rule, value in rules.items():
+        try:
+            normalize(rule)
+        except ValueError:
+            _LOGGER.warning("[TCGA][TRACKER] Ignoring invalid rule %r in options", rule)
+            continue
+        valid[rule] = value
+    return rule_set_cls(valid)
+
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up device tracker entities for Technicolor CGA from a config entry."""
     _LOGGER.debug("[TCGA][TRACKER] async_setup_entry starting")
@@ -41,26 +81,38 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         scan_seconds = 10
     scan_interval = timedelta(seconds=scan_seconds)
 
-    # Filtering and naming options (prefer IP-based; keep MAC for backward compatibility)
-    disabled_ips = set(_normalize_ip(i) for i in config_entry.options.get("disabled_ips", []))
-    name_overrides_ip: Dict[str, str] = { _normalize_ip(k): v for k, v in config_entry.options.get("name_overrides_ip", {}).items() }
+    # Filtering and naming options (prefer IP-based; keep MAC for backward compatibility).
+    # Rules may be single addresses, CIDR networks or MAC prefixes; they are compiled
+    # once here so each host costs only a few lookups.
+    disabled_ips = _compile_rules(IPRuleSet, {i: True for i in config_entry.options.get("disabled_ips", [])})
+    name_overrides_ip = _compile_rules(IPRuleSet, config_entry.options.get("name_overrides_ip", {}))
     # Back-compat
-    disabled_macs = set(_normalize_mac(m) for m in config_entry.options.get("disabled_macs", []))
-    name_overrides_mac: Dict[str, str] = { _normalize_mac(k): v for k, v in config_entry.options.get("name_overrides", {}).items() }
+    disabled_macs = _compile_rules(MACRuleSet, {m: True for m in config_entry.options.get("disabled_macs", [])})
+    name_overrides_mac = _compile_rules(MACRuleSet, config_entry.options.get("name_overrides", {}))
 
     _LOGGER.info(
         "[TCGA][TRACKER] Setup for host=%s scan_interval=%ss disabled_ips=%d name_overrides_ip=%d (legacy disabled_macs=%d name_overrides_macs=%d)",
         host, scan_seconds, len(disabled_ips), len(name_overrides_ip), len(disabled_macs), len(name_overrides_mac)
     )
-    _LOGGER.debug("[TCGA][TRACKER] Options detail disabled_ips=%s name_overrides_ip=%s disabled_macs=%s name_overrides_mac=%s", list(disabled_ips), name_overrides_ip, list(disabled_macs), name_overrides_mac)
+    _LOGGER.debug("[TCGA][TRACKER] Options detail %s", dict(config_entry.options))
+
+    # Vendor names for hosts without a hostname; reading the bundled index is blocking I/O
+    await hass.async_add_executor_job(oui.load)
 
     # Shared DataUpdateCoordinator that fetches the host table once per interval
     async def _async_update_data():
+        if technicolor_cga.suspended:
+            raise UpdateFailed("Gateway is rebooting")
         try:
+            # Restored setups log in here (or on a later tick if the gateway is still down)
+            await async_ensure_login(hass, config_entry.entry_id, technicolor_cga)
             data = await hass.async_add_executor_job(technicolor_cga.aDev)
             table = data.get("hostTbl", []) or []
             _LOGGER.debug("[TCGA][COORD] fetched hostTbl size=%d", len(table))
             return data
+        except CircuitOpenError as err:
+            # Gateway known to be unreachable; the coordinator marks entities unavailable
+            raise UpdateFailed(str(err)) from err
         except Exception as err:
             _LOGGER.exception("[TCGA][COORD] Error fetching host table")
             raise UpdateFailed(err) from err
@@ -73,12 +125,37 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         update_interval=scan_interval,
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    # Start from the last known host table if there is one and refresh in the background
+    # (see below); only a first setup without a snapshot waits for the gateway
+    snapshot = hass.data[DATA_SNAPSHOTS][config_entry.entry_id]
+    restored_at = snapshot.saved_at("aDev")
+    restored_data = snapshot.get("aDev")
+    if restored_at is not None:
+        coordinator.data = restored_data
+        _LOGGER.info("[TCGA][TRACKER] Restored hostTbl snapshot from %s; refreshing in background", restored_at)
+    else:
+        await coordinator.async_config_entry_first_refresh()
+        snapshot.update("aDev", coordinator.data)
+
+    # Shared with services (profiling) and the websocket API (host table queries)
+    host_table = hosts.HostTable(vendor_of=oui.vendor)
+    host_table.update((coordinator.data or {}).get("hostTbl", []) or [])
+    hass.data.setdefault(DATA_COORDINATORS, {})[config_entry.entry_id] = coordinator
+    hass.data.setdefault(DATA_HOST_TABLES, {})[config_entry.entry_id] = host_table
+
+    @callback
+    def _forget_entry_data():
+        hass.data[DATA_COORDINATORS].pop(config_entry.entry_id, None)
+        hass.data[DATA_HOST_TABLES].pop(config_entry.entry_id, None)
+
+    config_entry.async_on_unload(_forget_entry_data)
 
     devices: List[dict] = (coordinator.data or {}).get("hostTbl", []) or []
     _LOGGER.info("[TCGA][TRACKER] Initial hostTbl size=%d", len(devices))
 
     entities: Dict[str, TechnicolorCGATrackerEntity] = {}
+    # IP -> MAC it had when found disabled; re-checked only when another device holds the IP
+    skipped: Dict[str, str | None] = {}
 
     def _add_entity_from_dev(dev: dict):
         ip_raw = dev.get("ipaddress")
@@ -87,15 +164,19 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         ip = _normalize_ip(ip_raw)
         if ip in entities:
             return
-        if ip in disabled_ips:
-            _LOGGER.info("[TCGA][TRACKER] Skipping disabled IP=%s", ip)
-            return
         mac_raw = dev.get("physaddress")
         mac = _normalize_mac(mac_raw) if mac_raw else None
+        if ip in skipped and skipped[ip] == mac:
+            return
+        if ip in disabled_ips or (mac and mac in disabled_macs):
+            _LOGGER.info("[TCGA][TRACKER] Skipping disabled IP=%s mac=%s", ip, mac)
+            skipped[ip] = mac
+            return
+        skipped.pop(ip, None)
         # Prefer IP overrides; fall back to MAC overrides for back-compat
-        name_override = name_overrides_ip.get(ip) if 'name_overrides_ip' in locals() else None
+        name_override = name_overrides_ip.get(ip)
         if not name_override and mac:
-            name_override = name_overrides_mac.get(mac) if 'name_overrides_mac' in locals() else None
+            name_override = name_overrides_mac.get(mac)
         entity = TechnicolorCGATrackerEntity(
             coordinator=coordinator,
             technicolor_cga=technicolor_cga,
@@ -106,6 +187,8 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
             mac=mac,
             initial=dev,
             name_override=name_override,
+            # Only entities built from the restored table start out stale
+            restored_at=restored_at if restored_at is not None and coordinator.data is restored_data else None,
         )
         entities[ip] = entity
         _LOGGER.info(
@@ -119,19 +202,62 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 
     _LOGGER.info("[TCGA][TRACKER] Added %d tracker entities", len(entities))
 
-    # Listen to coordinator updates to discover new devices
+    # Previous hostTbl snapshot; the first live table is the baseline and fires no events
+    last_snapshot = {"hosts": None if restored_at is not None else hosts.snapshot(devices)}
+
+    def _fire_host_events(table: list[dict]):
+        current = hosts.snapshot(table)
+        if last_snapshot["hosts"] is None:
+            last_snapshot["hosts"] = current
+            return
+        for change in hosts.diff(last_snapshot["hosts"], current):
+            state = change.current or change.previous
+            event_data = {
+                "config_entry_id": config_entry.entry_id,
+                "host": host,
+                "mac": change.mac,
+                "ip": state.ip,
+                "hostname": state.hostname,
+            }
+            if change.kind == hosts.IP_CHANGED:
+                event_data["previous_ip"] = change.previous.ip
+            elif change.kind == hosts.HOSTNAME_CHANGED:
+                event_data["previous_hostname"] = change.previous.hostname
+            _LOGGER.debug("[TCGA][EVENT] %s %s", change.kind, event_data)
+            hass.bus.async_fire(HOST_CHANGE_EVENTS[change.kind], event_data)
+        last_snapshot["hosts"] = current
+
+    # Listen to coordinator updates to discover new devices and fire join/leave events
     def _on_coordinator_update():
         table = (coordinator.data or {}).get("hostTbl", []) or []
         for dev in table:
             _add_entity_from_dev(dev)
+        if coordinator.last_update_success:
+            _fire_host_events(table)
+            host_table.update(table)
+            snapshot.update("aDev", coordinator.data)
+
+    config_entry.async_on_unload(coordinator.async_add_listener(_on_coordinator_update))
+
+    if restored_at is not None:
+        config_entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} tracker refresh {config_entry.entry_id}"
+        )
 
-    coordinator.async_add_listener(_on_coordinator_update)
+    # Refresh right away once a reboot has finished instead of waiting for the next tick
+    @callback
+    def _on_gateway_resumed():
+        hass.async_create_task(coordinator.async_request_refresh())
+
+    config_entry.async_on_unload(
+        async_dispatcher_connect(hass, SIGNAL_GATEWAY_RESUMED.format(config_entry.entry_id), _on_gateway_resumed)
+    )
 
 
 class TechnicolorCGATrackerEntity(CoordinatorEntity, TrackerEntity):
     """A device tracker for a single IP from the Technicolor CGA router (coordinator‑backed)."""
 
-    def __init__(self, coordinator: DataUpdateCoordinator, technicolor_cga, hass, config_entry_id, host, ip: str, mac: str | None, initial: dict | None = None, name_override: str | None = None):
+    def __init__(self, coordinator: DataUpdateCoordinator, technicolor_cga, hass, config_entry_id, host, ip: str, mac: str | None, initial: dict | None = None, name_override: str | None = None, restored_at: str | None = None):
         super().__init__(coordinator)
         self.technicolor_cga = technicolor_cga
         self.hass = hass
@@ -139,12 +265,17 @@ class TechnicolorCGATrackerEntity(CoordinatorEntity, TrackerEntity):
         self._host = host
         self._ip = ip
         self._mac = mac
+        self._vendor = oui.vendor(mac) if mac else None
         self._hostname = None
         self._is_connected = False
         self._status_raw = None
         self._active_raw = None
         self._name_override = name_override
         self._last_seen = None
+        # Snapshot time and data of the host table the coordinator started from, if restored.
+        # Cleared once coordinator.data is another object: live data (failed refreshes keep the old one)
+        self._restored_at = restored_at
+        self._restored_data = coordinator.data if restored_at is not None else None
         self._attr_should_poll = False  # coordinator drives updates
         if initial is not None:
             self._apply_device(initial)
@@ -163,7 +294,7 @@ class TechnicolorCGATrackerEntity(CoordinatorEntity, TrackerEntity):
     @property
     def name(self) -> str:
         # Return current display name (hostname preferred), also synced to _attr_name for registry display
-        base = self._name_override or self._hostname or self._ip
+        base = self._name_override or self._hostname or (f"{self._vendor} {self._ip}" if self._vendor else self._ip)
         display = f"{base} Network Presence"
         # Keep _attr_name in sync so UI shows hostname if it becomes available
         try:
@@ -173,6 +304,11 @@ class TechnicolorCGATrackerEntity(CoordinatorEntity, TrackerEntity):
             pass
         return display
 
+    @property
+    def stale(self) -> bool:
+        """True while the entity shows the restored host table (no live refresh yet)."""
+        return self._restored_at is not None
+
     @property
     def is_connected(self) -> bool:
         return self._is_connected
@@ -212,9 +348,12 @@ class TechnicolorCGATrackerEntity(CoordinatorEntity, TrackerEntity):
             "mac": self._mac,
             "ip": self._ip,
             "hostname": self._hostname,
+            "vendor": self._vendor,
+            "randomized_mac": oui.is_randomized(self._mac) if self._mac else None,
             "status_raw": self._status_raw,
             "active_raw": self._active_raw,
             "last_seen": self._last_seen,
+            "stale": self.stale,
             "source": "router",
         }
 
@@ -242,6 +381,8 @@ class TechnicolorCGATrackerEntity(CoordinatorEntity, TrackerEntity):
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        if self._restored_at is not None and self.coordinator.data is not self._restored_data:
+            self._restored_at = self._restored_data = None
         data = self.coordinator.data or {}
         table = data.get("hostTbl", []) or []
         _LOGGER.info("[TCGA][TRACKER] coordinator tick ip=%s table_size=%d avail=%s", self._ip, len(table), self.available)
@@ -290,5 +431,5 @@ class TechnicolorCGATrackerEntity(CoordinatorEntity, TrackerEntity):
         self._status_raw = dev.get("Status", dev.get("status"))
         # Mirror sensor presence decision
         self._is_connected = self._is_online(dev)
-        # Update last seen timestamp when we have a row for this IP
-        self._last_seen = datetime.now().isoformat()
+        # Update last seen timestamp when we have a row for this IP (restored rows: when it was saved)
+        self._last_seen = self._restored_at if self.stale else datetime.now().isoformat()
@@ -0,0 +1,132 @@
+"""DOCSIS channel readings from the `levels()` (modem) tables.
+
+`DSTbl`/`USTbl` hold the SC-QAM channels, `exDSTbl`/`exUSTbl` the DOCSIS 3.1
+OFDM/OFDMA channels and `ErrTbl` the per-channel codeword counters. Firmware
+versions differ in field names and report values with units ("3.1 dBmV",
+"570 MHz"), so everything is looked up by a few known names and reduced to
+plain numbers here.
+"""
+
+import re
+from typing import NamedTuple
+
+DOWNSTREAM = "downstream"
+UPSTREAM = "upstream"
+
+# table -> (direction, channel type)
+_TABLES = {
+    "DSTbl": (DOWNSTREAM, "sc-qam"),
+    "exDSTbl": (DOWNSTREAM, "ofdm"),
+    "USTbl": (UPSTREAM, "sc-qam"),
+    "exUSTbl": (UPSTREAM, "ofdma"),
+}
+
+# metric -> field names seen on CGA firmware
+_LEVEL_FIELDS = {
+    "power": ("PowerLevel", "Power", "power", "powerLevel"),
+    "snr": ("SNRLevel", "SNR", "snr", "MER"),
+    "frequency": ("Frequency", "CentralFrequency", "frequency", "StartFrequency"),
+}
+_ERROR_FIELDS = {
+    "unerrored": ("Unerrored", "unerrored", "UnerroredCodewords"),
+    "corrected": ("Correctable", "Corrected", "correctable", "CorrectableCodewords"),
+    "uncorrectable": ("Uncorrectable", "Uncorrected", "uncorrectable", "UncorrectableCodewords"),
+}
+_CHANNEL_FIELDS = ("ChannelID", "channelid", "ChannelId", "__id")
+
+_NUMBER_RE = re.compile(r"(-?\d+(?:\.\d+)?)\s*([kmg]hz)?", re.IGNORECASE)
+_HZ = {"khz": 1e3, "mhz": 1e6, "ghz": 1e9}
+
+
+class ChannelReading(NamedTuple):
+    direction: str
+    channel_type: str
+    channel: str
+    metric: str
+    value: float
+
+
+def parse_number(value) -> float | None:
+    """First number in a value like "3.1 dBmV" or "-2"; kHz/MHz/GHz are scaled to Hz."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = _NUMBER_RE.search(str(value))
+    if not match:
+        return None
+    number = float(match.group(1))
+    unit = match.group(2)
+    return number * _HZ[unit.lower()] if unit else number
+
+
+def _field(row: dict, names):
+    for name in names:
+        if row.get(name) not in (None, ""):
+            return row[name]
+    return None
+
+
+def _channel(row: dict) -> str | None:
+    channel = _field(row, _CHANNEL_FIELDS)
+    return None if channel is None else str(channel).strip()
+
+
+def channel_readings(levels: dict) -> list[ChannelReading]:
+    """Flatten a levels() reply into one reading per channel and metric.
+
+    Error counters from ErrTbl are reported as downstream SC-QAM readings.
+    Rows without a channel id or a parseable value are skipped.
+    """
+    readings = []
+    for table, (direction, channel_type) in _TABLES.items():
+        for row in (levels or {}).get(table) or []:
+            channel = _channel(row)
+            if channel is None:
+                continue
+            for metric, names in _LEVEL_FIELDS.items():
+                value = parse_number(_field(row, names))
+                if value is not None:
+                    readings.append(ChannelReading(direction, channel_type, channel, metric, value))
+    for row in (levels or {}).get("ErrTbl") or []:
+        channel = _channel(row)
+        if channel is None:
+            continue
+        for metric, names in _ERROR_FIELDS.items():
+            value = parse_number(_field(row, names))
+            if value is not None:
+                readings.append(ChannelReading(DOWNSTREAM, "sc-qam", channel, metric, value))
+    return readings
+
+
+def level_summary(levels: dict) -> dict:
+    """Per-direction channel counts and power/SNR ranges, plus codeword error totals.
+
+    {"downstream": {"channels": 32, "power_min": ..., "power_max": ..., "snr_min": ..., "snr_avg": ...},
+     "upstream": {...}, "corrected": ..., "uncorrectable": ...}; missing values are None.
+    """
+    values: dict[tuple[str, str], list[float]] = {}
+    channels: dict[str, set] = {DOWNSTREAM: set(), UPSTREAM: set()}
+    errors = {"corrected": None, "uncorrectable": None}
+    for reading in channel_readings(levels):
+        if reading.metric in errors:
+            errors[reading.metric] = (errors[reading.metric] or 0) + reading.value
+            continue
+        if reading.metric not in ("power", "snr"):
+            continue
+        channels[reading.direction].add((reading.channel_type, reading.channel))
+        values.setdefault((reading.direction, reading.metric), []).append(reading.value)
+
+    summary = {}
+    for direction in (DOWNSTREAM, UPSTREAM):
+        power = values.get((direction, "power"), [])
+        snr = values.get((direction, "snr"), [])
+        summary[direction] = {
+            "channels": len(channels[direction]),
+            "power_min": min(power) if power else None,
+            "power_max": max(power) if power else None,
+            "snr_min": min(snr) if snr else None,
+            "snr_avg": round(sum(snr) / len(snr), 1) if snr else None,
+        }
+    summary.update(errors)
+    return summary
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Standalone Prometheus exporter for one or more Technicolor CGA gateways.
+
+Usage:
+  python3 exporter.py --username <user> --password <pass> --host 192.168.0.1 [--host 192.168.1.1] [--port 9745] [--interval 60]
+  python3 exporter.py --gateways gateways.json [--port 9745] [--interval 60]
+
+Each gateway is polled on its own background thread with the same router client
+as the Home Assistant integration (technicolor_cga.TechnicolorCGA): host table
+(aDev), DOCSIS levels (levels) and uptime/memory (system). The latest results
+are rendered once per poll and /metrics serves that cached text, so scrapes
+never cause router requests, however many scrapers there are.
+
+The --gateways file is a JSON list of {"host", "username", "password"} objects
+with an optional "name" used as the gateway label (default: the host); entries
+without credentials use --username/--password. test.py --fleet reads the same
+format.
+"""
+
+import argparse
+import json
+import logging
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from docsis import channel_readings
+from health import parse_memory, parse_uptime
+from hosts import snapshot
+from technicolor_cga import TechnicolorCGA
+
+_LOGGER = logging.getLogger("technicolor_cga.exporter")
+
+POLL_ENDPOINTS = ("aDev", "levels", "system")
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# family -> (type, help); rendering follows this order
+FAMILIES = {
+    "technicolor_cga_up": ("gauge", "1 if the last poll reached the gateway and was logged in."),
+    "technicolor_cga_poll_success": ("gauge", "1 if the endpoint was fetched successfully in the last poll."),
+    "technicolor_cga_poll_duration_seconds": ("gauge", "Duration of the endpoint fetch in the last poll."),
+    "technicolor_cga_last_poll_timestamp_seconds": ("gauge", "Unix time the last poll finished."),
+    "technicolor_cga_hosts": ("gauge", "Hosts in the gateway host table by state."),
+    "technicolor_cga_host_online": ("gauge", "1 if the host is online, 0 if it is listed but offline."),
+    "technicolor_cga_uptime_seconds": ("gauge", "Gateway uptime."),
+    "technicolor_cga_memory_total_bytes": ("gauge", "Gateway total memory."),
+    "technicolor_cga_memory_free_bytes": ("gauge", "Gateway free memory."),
+    "technicolor_cga_docsis_power_dbmv": ("gauge", "DOCSIS channel power level."),
+    "technicolor_cga_docsis_snr_db": ("gauge", "DOCSIS channel SNR/MER."),
+    "technicolor_cga_docsis_frequency_hz": ("gauge", "DOCSIS channel frequency."),
+    "technicolor_cga_docsis_codewords_total": ("counter", "DOCSIS downstream codewords by error state."),
+}
+
+_LEVEL_FAMILIES = {
+    "power": "technicolor_cga_docsis_power_dbmv",
+    "snr": "technicolor_cga_docsis_snr_db",
+    "frequency": "technicolor_cga_docsis_frequency_hz",
+}
+_CODEWORD_STATES = ("unerrored", "corrected", "uncorrectable")
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value) -> str:
+    value = float(value)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _sample(family: str, labels: dict, value) -> str:
+    label_text = ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+    return f"{family}{{{label_text}}} {_number(value)}"
+
+
+def gateway_samples(gateway: str, results: dict, up: bool, finished: float) -> dict[str, list[str]]:
+    """Samples per metric family for one poll of one gateway."""
+    samples: dict[str, list[str]] = {family: [] for family in FAMILIES}
+    base = {"gateway": gateway}
+
+    def add(family, value, **labels):
+        if value is not None:
+            samples[family].append(_sample(family, {**base, **labels}, value))
+
+    add("technicolor_cga_up", 1 if up else 0)
+    add("technicolor_cga_last_poll_timestamp_seconds", round(finished, 3))
+    for name, result in results.items():
+        add("technicolor_cga_poll_success", 1 if result.ok else 0, endpoint=name)
+        add("technicolor_cga_poll_duration_seconds", round(result.elapsed, 4), endpoint=name)
+
+    hosts = results.get("aDev")
+    if hosts is not None and hosts.ok:
+        table = snapshot(hosts.data.get("hostTbl"))
+        online = sum(1 for state in table.values() if state.online)
+        add("technicolor_cga_hosts", online, state="online")
+        add("technicolor_cga_hosts", len(table) - online, state="offline")
+        for mac, state in sorted(table.items()):
+            add("technicolor_cga_host_online", 1 if state.online else 0, mac=mac, ip=state.ip, hostname=state.hostname)
+
+    system = results.get("system")
+    if system is not None and system.ok:
+        add("technicolor_cga_uptime_seconds", parse_uptime(system.data.get("UpTime")))
+        for key, family in (("MemTotal", "technicolor_cga_memory_total_bytes"), ("MemFree", "technicolor_cga_memory_free_bytes")):
+            kilobytes = parse_memory(system.data.get(key))
+            add(family, None if kilobytes is None else int(kilobytes * 1024))
+
+    levels = results.get("levels")
+    if levels is not None and levels.ok:
+        for reading in channel_readings(levels.data):
+            labels = {"direction": reading.direction, "channel_type": reading.channel_type, "channel": reading.channel}
+            if reading.metric in _LEVEL_FAMILIES:
+                add(_LEVEL_FAMILIES[reading.metric], reading.value, **labels)
+            elif reading.metric in _CODEWORD_STATES:
+                add("technicolor_cga_docsis_codewords_total", reading.value, channel=reading.channel, state=reading.metric)
+
+    return samples
+
+
+class MetricsCache:
+    """Latest samples of every gateway, pre-rendered in Prometheus text format."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._gateways: dict[str, dict[str, list[str]]] = {}
+        self.body = b""
+
+    def update(self, gateway: str, samples: dict[str, list[str]]):
+        with self._lock:
+            self._gateways[gateway] = samples
+            lines = []
+            # Samples of a family must be grouped, so merge the gateways per family
+            for family, (kind, help_text) in FAMILIES.items():
+                family_lines = [line for per_gateway in self._gateways.values() for line in per_gateway.get(family, ())]
+                if not family_lines:
+                    continue
+                lines.append(f"# HELP {family} {help_text}")
+                lines.append(f"# TYPE {family} {kind}")
+                lines.extend(family_lines)
+            self.body = ("\n".join(lines) + "\n").encode("utf-8")
+
+
+class GatewayPoller(threading.Thread):
+    """Poll one gateway every `interval` seconds into the shared cache."""
+
+    def __init__(self, name: str, client: TechnicolorCGA, cache: MetricsCache, interval: float, delay: float = 0.0):
+        super().__init__(name=f"poll-{name}", daemon=True)
+        self.gateway = name
+        self.client = client
+        self.cache = cache
+        self.interval = interval
+        self.delay = delay
+        self.stop_event = threading.Event()
+
+    def poll_once(self):
+        results = {}
+        up = False
+        try:
+            if not self.client.logged:
+                self.client.login()
+            results = self.client.fetch_many(POLL_ENDPOINTS)
+            up = any(result.ok for result in results.values())
+            failed = [name for name, result in results.items() if not result.ok]
+            if failed:
+                # Usually an expired session; log in again on the next poll
+                self.client.logged = False
+                _LOGGER.warning("[TCGA][EXPORTER] %s: failed to fetch %s: %s", self.gateway, ", ".join(failed), results[failed[0]].error)
+        except Exception as err:
+            self.client.logged = False
+            _LOGGER.warning("[TCGA][EXPORTER] %s: poll failed: %s", self.gateway, err)
+        self.cache.update(self.gateway, gateway_samples(self.gateway, results, up, time.time()))
+
+    def run(self):
+        # Spread gateways over the interval instead of polling them all at once
+        if self.stop_event.wait(self.delay):
+            return
+        while True:
+            started = time.monotonic()
+            self.poll_once()
+            if self.stop_event.wait(max(0.0, self.interval - (time.monotonic() - started))):
+                return
+
+
+def _handler(cache: MetricsCache):
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                self.send_error(404)
+                return
+            body = cache.body
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            _LOGGER.debug("[TCGA][EXPORTER] %s " + format, self.address_string(), *args)
+
+    return MetricsHandler
+
+
+def load_gateways(path: str, username: str | None = None, password: str | None = None) -> list[dict]:
+    """Gateways from a JSON list of {"host", "username", "password"[, "name"]} objects.
+
+    Entries without credentials use `username`/`password` when given.
+    """
+    with open(path, encoding="utf-8") as fh:
+        entries = json.load(fh)
+    if not isinstance(entries, list):
+        raise ValueError(f"{path}: expected a JSON list of gateways")
+    gateways = []
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            raise ValueError(f"{path}: gateway #{index + 1} is not an object")
+        entry = {"username": username, "password": password, **{k: v for k, v in entry.items() if v}}
+        missing = [key for key in ("host", "username", "password") if not entry.get(key)]
+        if missing:
+            raise ValueError(f"{path}: gateway #{index + 1} is missing {', '.join(missing)}")
+        gateways.append({**entry, "name": entry.get("name") or entry["host"]})
+    return gateways
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Export Technicolor CGA metrics for Prometheus")
+    parser.add_argument("--username", help="Router username (with --host)")
+    parser.add_argument("--password", help="Router password (with --host)")
+    parser.add_argument("--host", action="append", default=[], help="Router IP/host; repeat for several gateways with the same credentials")
+    parser.add_argument("--gateways", metavar="FILE", help="JSON list of gateways with their own credentials")
+    parser.add_argument("--listen", default="127.0.0.1", help="Address to serve /metrics on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=9745, help="Port to serve /metrics on (default: 9745)")
+    parser.add_argument("--interval", type=float, default=60.0, help="Seconds between polls of each gateway, minimum 10 (default: 60)")
+    parser.add_argument("--verbose", action="store_true", help="Log every poll and scrape")
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    gateways = []
+    if args.gateways:
+        try:
+            gateways.extend(load_gateways(args.gateways, args.username, args.password))
+        except (OSError, ValueError) as e:
+            print(f"Invalid gateways file: {e}", file=sys.stderr)
+            return 1
+    if args.host:
+        if not args.username or not args.password:
+            parser.error("--host requires --username and --password")
+        gateways.extend({"name": host, "host": host, "username": args.username, "password": args.password} for host in args.host)
+    if not gateways:
+        parser.error("give at least one --host or a --gateways file")
+
+    interval = max(10.0, args.interval)
+    cache = MetricsCache()
+    pollers = [
+        GatewayPoller(gw["name"], TechnicolorCGA(gw["username"], gw["password"], gw["host"]), cache, interval, delay=index * interval / len(gateways))
+        for index, gw in enumerate(gateways)
+    ]
+    for poller in pollers:
+        poller.start()
+
+    server = ThreadingHTTPServer((args.listen, args.port), _handler(cache))
+    _LOGGER.info("[TCGA][EXPORTER] Serving metrics for %d gateway(s) on http://%s:%d/metrics", len(pollers), args.listen, args.port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        for poller in pollers:
+            poller.stop_event.set()
+            poller.client.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,173 @@
+"""Gateway health tracking from the `system()` UpTime/MemTotal/MemFree fields.
+
+Everything here is O(1) per sample with bounded memory: reboots are detected by
+comparing each uptime with the previous one, and the free-memory trend is a
+least-squares slope over a fixed-size sliding window maintained with running
+sums.
+"""
+
+import re
+import time
+from collections import deque
+
+_UNIT_SECONDS = {"d": 86400, "h": 3600, "m": 60, "s": 1}
+_UNIT_RE = re.compile(r"(\d+)\s*(d|h|m|s)", re.IGNORECASE)
+_CLOCK_RE = re.compile(r"(\d+):(\d{2}):(\d{2})")
+_NUMBER_RE = re.compile(r"(\d+(?:\.\d+)?)\s*([kmg]i?b|b)?", re.IGNORECASE)
+_MEMORY_KB = {"b": 1 / 1024, "kb": 1, "kib": 1, "mb": 1024, "mib": 1024, "gb": 1024 ** 2, "gib": 1024 ** 2}
+
+
+def parse_uptime(value) -> int | None:
+    """Seconds from the formats seen on CGA firmware.
+
+    Accepts plain seconds ("93784"), unit groups ("1 days 02h:03m:04s",
+    "1d 2h 3m 4s", ISO-8601 "P1DT2H3M4S") and clock notation, optionally with
+    days ("1 day, 02:03:04").
+    """
+    if value is None:
+        return None
+    text = str(value).strip()
+    if text.isdigit():
+        return int(text)
+
+    total = 0
+    found = False
+    clock = _CLOCK_RE.search(text)
+    if clock:
+        hours, minutes, seconds = (int(g) for g in clock.groups())
+        total += hours * 3600 + minutes * 60 + seconds
+        found = True
+        text = text[:clock.start()] + text[clock.end():]
+    for amount, unit in _UNIT_RE.findall(text):
+        total += int(amount) * _UNIT_SECONDS[unit.lower()]
+        found = True
+    return total if found else None
+
+
+def parse_memory(value) -> float | None:
+    """KiB from "123456", "123456 kB" or "120 MB" (bare numbers are kB; units are powers of 1024)."""
+    if value is None:
+        return None
+    match = _NUMBER_RE.search(str(value))
+    if not match:
+        return None
+    unit = (match.group(2) or "kb").lower()
+    return float(match.group(1)) * _MEMORY_KB[unit]
+
+
+class HealthMonitor:
+    """Incremental reboot and memory-leak detection for one gateway.
+
+    `window` bounds the number of free-memory samples kept for the trend; samples
+    closer than `min_sample_spacing` seconds to the previous one are skipped. A leak
+    is suspected once the window spans at least `min_span_hours` and free
+    memory falls faster than `leak_pct_per_hour` percent of total per hour.
+    """
+
+    def __init__(self, window=120, min_span_hours=1.0, leak_pct_per_hour=1.0, expected_reboot_window=1800, min_sample_spacing=5.0):
+        self.window = window
+        self.min_sample_spacing = min_sample_spacing
+        self.min_span_hours = min_span_hours
+        self.leak_pct_per_hour = leak_pct_per_hour
+        self.expected_reboot_window = expected_reboot_window
+
+        self.uptime = None
+        self.mem_total = None
+        self.mem_free = None
+        self.boot_time = None
+        self.reboots = 0
+        self.unexpected_reboots = 0
+        self.last_reboot = None
+        self.last_reboot_expected = None
+
+        self._last_data = None
+        self._t0 = None
+        self._samples = deque()
+        self._n = 0
+        self._sx = self._sy = self._sxx = self._sxy = 0.0
+
+    def update(self, system_data: dict, now: float | None = None, reboot_requested_at: float | None = None):
+        """Feed one system() reply; the same dict passed again is ignored."""
+        if system_data is self._last_data:
+            return
+        self._last_data = system_data
+        now = time.time() if now is None else now
+
+        uptime = parse_uptime(system_data.get("UpTime"))
+        if uptime is not None:
+            if self.uptime is not None and uptime < self.uptime:
+                self._record_reboot(now, reboot_requested_at)
+            self.uptime = uptime
+            self.boot_time = now - uptime
+
+        self.mem_total = parse_memory(system_data.get("MemTotal"))
+        mem_free = parse_memory(system_data.get("MemFree"))
+        self.mem_free = mem_free
+        if mem_free is not None:
+            self._add_sample(now, mem_free)
+
+    def _record_reboot(self, now, reboot_requested_at):
+        expected = reboot_requested_at is not None and now - reboot_requested_at <= self.expected_reboot_window
+        self.reboots += 1
+        if not expected:
+            self.unexpected_reboots += 1
+        self.last_reboot = now
+        self.last_reboot_expected = expected
+        # Memory starts over after a reboot; the old trend no longer applies
+        self._reset_trend()
+
+    def _reset_trend(self):
+        self._t0 = None
+        self._samples.clear()
+        self._n = 0
+        self._sx = self._sy = self._sxx = self._sxy = 0.0
+
+    def _add_sample(self, now, mem_free):
+        if self._t0 is None:
+            self._t0 = now
+        x = (now - self._t0) / 3600.0
+        # Back-to-back replies (e.g. at startup) add noise, not trend information
+        if self._samples and (x - self._samples[-1][0]) * 3600.0 < self.min_sample_spacing:
+            return
+        self._samples.append((x, mem_free))
+        self._n += 1
+        self._sx += x
+        self._sy += mem_free
+        self._sxx += x * x
+        self._sxy += x * mem_free
+        if self._n > self.window:
+            ox, oy = self._samples.popleft()
+            self._n -= 1
+            self._sx -= ox
+            self._sy -= oy
+            self._sxx -= ox * ox
+            self._sxy -= ox * oy
+
+    @property
+    def trend_span_hours(self) -> float:
+        if self._n < 2:
+            return 0.0
+        return self._samples[-1][0] - self._samples[0][0]
+
+    @property
+    def mem_free_slope(self) -> float | None:
+        """Least-squares change of free memory in KiB per hour over the window."""
+        if self._n < 2:
+            return None
+        denom = self._n * self._sxx - self._sx * self._sx
+        if denom <= 0:
+            return None
+        return (self._n * self._sxy - self._sx * self._sy) / denom
+
+    @property
+    def mem_used_pct(self) -> float | None:
+        if not self.mem_total or self.mem_free is None:
+            return None
+        return 100.0 * (self.mem_total - self.mem_free) / self.mem_total
+
+    @property
+    def leak_suspected(self) -> bool:
+        slope = self.mem_free_slope
+        if slope is None or not self.mem_total or self.trend_span_hours < self.min_span_hours:
+            return False
+        return -slope >= self.mem_total * self.leak_pct_per_hour / 100.0
@@ -0,0 +1,193 @@
+"""Host table snapshots and diffs, shared by the integration and the CLI.
+
+A snapshot maps each normalized MAC address in `hostTbl` to its IP, hostname
+and online state. Diffing two consecutive snapshots yields join/leave/IP/
+hostname change events in a single O(n) pass. HostTable keeps the latest table
+in query-ready form for paged, filtered lookups.
+"""
+
+import ipaddress
+import itertools
+import time
+from typing import NamedTuple
+
+JOINED = "joined"
+LEFT = "left"
+IP_CHANGED = "ip_changed"
+HOSTNAME_CHANGED = "hostname_changed"
+
+
+class HostState(NamedTuple):
+    ip: str
+    hostname: str
+    online: bool
+
+
+class HostChange(NamedTuple):
+    kind: str
+    mac: str
+    current: HostState | None
+    previous: HostState | None
+
+
+def normalize_mac(mac: str) -> str:
+    mac = (mac or "").strip().lower().replace("-", ":")
+    parts = [p.zfill(2) for p in mac.split(":") if p]
+    return ":".join(parts)
+
+
+def _coerce_bool(value):
+    if isinstance(value, bool):
+        return value
+    s = str(value).strip().lower()
+    if s in ("true", "1", "yes", "on"):
+        return True
+    if s in ("false", "0", "no", "off", "none", ""):
+        return False
+    return None
+
+
+def is_online(dev: dict) -> bool:
+    """Same presence rule as the trackers: Active first, then Status ONLINE/offline."""
+    active = dev.get("active")
+    if active is None:
+        active = dev.get("Active")
+    active_bool = _coerce_bool(active)
+    if active_bool is not None:
+        return active_bool
+    status = str(dev.get("Status", dev.get("status", "")))
+    if status.upper() == "ONLINE":
+        return True
+    if status.lower() == "offline":
+        return False
+    return bool(_coerce_bool(active))
+
+
+def snapshot(table: list[dict]) -> dict[str, HostState]:
+    """Map normalized MAC -> HostState for every row of hostTbl that has a MAC."""
+    result = {}
+    for dev in table or []:
+        mac = normalize_mac(dev.get("physaddress"))
+        if not mac:
+            continue
+        result[mac] = HostState(
+            (dev.get("ipaddress") or "").strip(),
+            (dev.get("hostname") or "").strip(),
+            is_online(dev),
+        )
+    return result
+
+
+def diff(previous: dict[str, HostState], current: dict[str, HostState]) -> list[HostChange]:
+    """Changes between two snapshots.
+
+    A host joins when it becomes online (new, or previously offline) and leaves
+    when it was online and is now offline or gone from the table. IP and
+    hostname changes are reported for hosts present in both snapshots.
+    """
+    changes = []
+    for mac, cur in current.items():
+        prev = previous.get(mac)
+        if cur.online and (prev is None or not prev.online):
+            changes.append(HostChange(JOINED, mac, cur, prev))
+        elif prev is not None and prev.online and not cur.online:
+            changes.append(HostChange(LEFT, mac, cur, prev))
+        if prev is None:
+            continue
+        if cur.ip and prev.ip and cur.ip != prev.ip:
+            changes.append(HostChange(IP_CHANGED, mac, cur, prev))
+        if cur.hostname and cur.hostname != prev.hostname:
+            changes.append(HostChange(HOSTNAME_CHANGED, mac, cur, prev))
+    for mac, prev in previous.items():
+        if prev.online and mac not in current:
+            changes.append(HostChange(LEFT, mac, None, prev))
+    return changes
+
+
+SORT_KEYS = ("ip", "hostname", "last_seen")
+
+
+def _ip_number(ip: str):
+    """(version, integer) for sorting and subnet checks, or None if not an address."""
+    try:
+        address = ipaddress.ip_address(ip)
+    except ValueError:
+        return None
+    return address.version, int(address)
+
+
+class HostTable:
+    """Latest host table with per-MAC last-seen times, for paged queries.
+
+    Rows are pre-sorted by every key in SORT_KEYS when the table is updated
+    (once per poll), so a query is a single filtered pass over one order.
+    Rows without a value for the sort key (no hostname, never seen online,
+    unparseable IP) come last in either direction.
+    """
+
+    def __init__(self, vendor_of=None):
+        self._vendor_of = vendor_of
+        self.last_seen: dict[str, float] = {}
+        self.updated = None
+        self.rows: list[dict] = []
+        self._orders: dict[str, tuple[list[dict], list[dict]]] = {key: ([], []) for key in SORT_KEYS}
+        self._ip_numbers: dict[int, tuple] = {}
+
+    def update(self, table: list[dict], now: float | None = None):
+        now = time.time() if now is None else now
+        rows = []
+        for mac, state in snapshot(table).items():
+            if state.online:
+                self.last_seen[mac] = now
+            rows.append({
+                "mac": mac,
+                "ip": state.ip,
+                "hostname": state.hostname,
+                "online": state.online,
+                "vendor": self._vendor_of(mac) if self._vendor_of else None,
+                "last_seen": self.last_seen.get(mac),
+            })
+        # Only hosts still in the table need a last-seen time
+        self.last_seen = {row["mac"]: row["last_seen"] for row in rows if row["last_seen"] is not None}
+        self.rows = rows
+        self.updated = now
+        self._ip_numbers = {id(row): _ip_number(row["ip"]) for row in rows}
+
+        sort_values = {
+            "ip": lambda row: self._ip_numbers[id(row)],
+            "hostname": lambda row: row["hostname"].casefold() or None,
+            "last_seen": lambda row: row["last_seen"],
+        }
+        for key, value_of in sort_values.items():
+            valued = [row for row in rows if value_of(row) is not None]
+            missing = [row for row in rows if value_of(row) is None]
+            valued.sort(key=lambda row: (value_of(row), row["mac"]))
+            self._orders[key] = (valued, missing)
+
+    def query(self, sort="ip", descending=False, offset=0, limit=50, online=None, subnet=None, mac_prefix=None):
+        """(matching count, one page of rows) for the given filters and order.
+
+        `subnet` is an ipaddress network and `mac_prefix` a normalized
+        "aa:bb:cc:" style prefix; callers validate user input.
+        """
+        valued, missing = self._orders[sort]
+        ordered = itertools.chain(reversed(valued) if descending else valued, missing)
+        span = None
+        if subnet is not None:
+            span = (subnet.version, int(subnet.network_address), int(subnet.broadcast_address))
+
+        matches = 0
+        page = []
+        for row in ordered:
+            if online is not None and row["online"] != online:
+                continue
+            if mac_prefix and not row["mac"].startswith(mac_prefix):
+                continue
+            if span is not None:
+                number = self._ip_numbers[id(row)]
+                if number is None or number[0] != span[0] or not span[1] <= number[1] <= span[2]:
+                    continue
+            if offset <= matches < offset + limit:
+                page.append(row)
+            matches += 1
+        return matches, page
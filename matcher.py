@@ -0,0 +1,191 @@
+"""Compiled IP/CIDR and MAC-prefix rule sets for disabling and naming devices.
+
+Rules are compiled once: IP rules (single addresses or CIDR networks) become
+sorted, non-overlapping integer ranges searched with bisect, MAC rules (full
+addresses or OUI/prefix wildcards) become a trie keyed by octet. A lookup is
+O(log n) for IPs and at most six dict lookups for MACs, independent of how
+many rules are configured. When rules overlap, the most specific one wins.
+"""
+
+import ipaddress
+import re
+from bisect import bisect_right
+
+_HEX_OCTET = re.compile(r"^[0-9a-f]{1,2}$")
+_LEAF = object()
+
+
+def normalize_ip_rule(text: str) -> str:
+    """Canonical form of an address ("192.168.0.10") or network ("192.168.50.0/24").
+
+    Raises ValueError for anything else.
+    """
+    text = (text or "").strip()
+    if "/" not in text:
+        return str(ipaddress.ip_address(text))
+    network = ipaddress.ip_network(text, strict=False)
+    if network.num_addresses == 1:
+        return str(network.network_address)
+    return str(network)
+
+
+def _mac_octets(text: str) -> list[str]:
+    """Octets of a MAC rule; a trailing "*" (or "*" octets) marks a prefix."""
+    text = (text or "").strip().lower().replace("-", ":")
+    if "." in text:
+        groups = text.split(".")
+        if all(len(g.rstrip("*")) <= 2 for g in groups):
+            # Octets separated by dots, e.g. "aa.bb.cc"
+            text = ":".join(groups)
+        elif ":" not in text and all(len(g) == 4 for g in groups[:-1]):
+            # Cisco-style groups of four, e.g. "aabb.ccdd.eeff" or "aabb.cc*"
+            text = "".join(groups)
+        else:
+            raise ValueError(f"invalid MAC address or prefix: {text!r}")
+    if ":" not in text:
+        # Bare hex like "aabbcc", "aabbcc*" or "aabbccddeeff"
+        digits = text.rstrip("*")
+        if len(digits) % 2:
+            raise ValueError(f"invalid MAC address or prefix: {text!r}")
+        text = ":".join(digits[i:i + 2] for i in range(0, len(digits), 2))
+    octets = [p for p in text.split(":") if p]
+    while octets and octets[-1] == "*":
+        octets.pop()
+    if not octets or len(octets) > 6 or not all(_HEX_OCTET.match(o) for o in octets):
+        raise ValueError(f"invalid MAC address or prefix: {text!r}")
+    return [o.zfill(2) for o in octets]
+
+
+def normalize_mac_rule(text: str) -> str:
+    """Canonical form of a MAC ("aa:bb:cc:dd:ee:ff") or prefix ("aa:bb:cc:*").
+
+    Accepts "-", "." or no separators, Cisco-style "aabb.ccdd.eeff" groups and
+    trailing "*" wildcards; prefixes given
+    without a wildcard (e.g. an OUI "AA-BB-CC") are treated as prefixes too.
+    Raises ValueError for anything else.
+    """
+    octets = _mac_octets(text)
+    if len(octets) == 6:
+        return ":".join(octets)
+    return ":".join(octets) + ":*"
+
+
+class IPRuleSet:
+    """Map addresses to the value of the most specific matching IP/CIDR rule."""
+
+    def __init__(self, rules: dict | None = None):
+        by_version: dict[int, dict] = {}
+        for rule, value in (rules or {}).items():
+            network = ipaddress.ip_network(normalize_ip_rule(rule), strict=False)
+            start = int(network.network_address)
+            end = int(network.broadcast_address)
+            by_version.setdefault(network.version, {})[(start, end)] = value
+        self._tables = {version: self._flatten(ranges) for version, ranges in by_version.items()}
+        self._size = sum(len(v) for v in by_version.values())
+
+    @staticmethod
+    def _flatten(ranges: dict):
+        """Turn nested/disjoint networks into sorted disjoint segments.
+
+        Networks never partially overlap, so a stack sweep over ranges sorted by
+        start (largest first) gives each segment the innermost network's value.
+        """
+        starts, ends, values = [], [], []
+
+        def _emit(lo, hi, value):
+            if lo > hi:
+                return
+            if ends and ends[-1] == lo - 1 and values[-1] == value:
+                ends[-1] = hi  # merge adjacent segments with the same value
+                return
+            starts.append(lo)
+            ends.append(hi)
+            values.append(value)
+
+        stack = []  # (end, value) of currently open networks, innermost last
+        pos = None
+        for (start, end), value in sorted(ranges.items(), key=lambda r: (r[0][0], -r[0][1])):
+            while stack and stack[-1][0] < start:
+                top_end, top_value = stack.pop()
+                _emit(pos, top_end, top_value)
+                pos = top_end + 1
+            if stack:
+                _emit(pos, start - 1, stack[-1][1])
+            stack.append((end, value))
+            pos = start
+        while stack:
+            top_end, top_value = stack.pop()
+            _emit(pos, top_end, top_value)
+            pos = top_end + 1
+        return starts, ends, values
+
+    def __len__(self):
+        return self._size
+
+    @staticmethod
+    def _to_int(ip):
+        """(version, integer) of an address, with a fast path for dotted IPv4."""
+        ip = (ip or "").strip()
+        parts = ip.split(".")
+        if len(parts) == 4:
+            try:
+                a, b, c, d = (int(p) for p in parts)
+            except ValueError:
+                return None
+            if 0 <= a <= 255 and 0 <= b <= 255 and 0 <= c <= 255 and 0 <= d <= 255:
+                return 4, (a << 24) | (b << 16) | (c << 8) | d
+            return None
+        try:
+            address = ipaddress.ip_address(ip)
+        except ValueError:
+            return None
+        return address.version, int(address)
+
+    def get(self, ip, default=None):
+        parsed = self._to_int(ip)
+        if parsed is None:
+            return default
+        version, number = parsed
+        table = self._tables.get(version)
+        if table is None:
+            return default
+        starts, ends, values = table
+        index = bisect_right(starts, number) - 1
+        if index >= 0 and number <= ends[index]:
+            return values[index]
+        return default
+
+    def __contains__(self, ip):
+        return self.get(ip, _LEAF) is not _LEAF
+
+
+class MACRuleSet:
+    """Map MAC addresses to the value of the longest matching MAC/prefix rule."""
+
+    def __init__(self, rules: dict | None = None):
+        self._root: dict = {}
+        self._size = 0
+        for rule, value in (rules or {}).items():
+            node = self._root
+            for octet in _mac_octets(rule):
+                node = node.setdefault(octet, {})
+            if _LEAF not in node:
+                self._size += 1
+            node[_LEAF] = value
+
+    def __len__(self):
+        return self._size
+
+    def get(self, mac, default=None):
+        found = self._root.get(_LEAF, default)
+        node = self._root
+        mac = (mac or "").strip().lower().replace("-", ":")
+        for octet in mac.split(":"):
+            node = node.get(octet.zfill(2))
+            if node is None:
+                break
+            found = node.get(_LEAF, found)
+        return found
+
+    def __contains__(self, mac):
+        return self.get(mac, _LEAF) is not _LEAF
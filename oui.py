@@ -0,0 +1,108 @@
+"""Offline MAC vendor (OUI) lookups from the bundled `oui.bin.gz` index.
+
+The index is the IEEE MA-L registry packed by build_oui.py into one blob:
+a sorted uint32 array of 24-bit OUIs searched with bisect, a uint16 vendor
+id per OUI and a deduplicated table of vendor names. It is read lazily on the
+first lookup and kept as a single bytes object with memoryviews over it, so
+the ~40k registry entries never become Python objects.
+
+Layout (little-endian):
+  header   magic b"TOUI", uint32 OUI count n, uint32 vendor count m
+  keys     n * uint32   OUI as an integer, ascending
+  vendors  n * uint16   index into the name table
+  offsets  (m + 1) * uint32   start of each name in the name blob, plus the end
+  names    utf-8 vendor names, concatenated
+"""
+
+import gzip
+import os
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+
+MAGIC = b"TOUI"
+HEADER = struct.Struct("<4sII")
+DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "oui.bin.gz")
+
+_lock = threading.Lock()
+_index = None
+
+
+class OUIIndex:
+    """Vendor lookups over one packed index blob."""
+
+    def __init__(self, blob: bytes):
+        magic, count, vendors = HEADER.unpack_from(blob, 0)
+        if magic != MAGIC:
+            raise ValueError("not an OUI index")
+        pos = HEADER.size
+        self._keys = self._view(blob, pos, count, "I")
+        pos += 4 * count
+        self._vendor_ids = self._view(blob, pos, count, "H")
+        pos += 2 * count
+        self._offsets = self._view(blob, pos, vendors + 1, "I")
+        pos += 4 * (vendors + 1)
+        self._names = memoryview(blob)[pos:]
+
+    @staticmethod
+    def _view(blob, pos, count, typecode):
+        size = array(typecode).itemsize
+        view = memoryview(blob)[pos:pos + count * size]
+        if sys.byteorder == "little":
+            return view.cast(typecode)
+        swapped = array(typecode, view.tobytes())
+        swapped.byteswap()
+        return swapped
+
+    def __len__(self):
+        return len(self._keys)
+
+    def vendor(self, mac: str) -> str | None:
+        """Vendor of a MAC address (any common notation), or None if unknown."""
+        digits = "".join(c for c in (mac or "")[:17] if c not in ":-. ")[:6]
+        if len(digits) != 6:
+            return None
+        try:
+            key = int(digits, 16)
+        except ValueError:
+            return None
+        index = bisect_left(self._keys, key)
+        if index == len(self._keys) or self._keys[index] != key:
+            return None
+        vendor_id = self._vendor_ids[index]
+        return bytes(self._names[self._offsets[vendor_id]:self._offsets[vendor_id + 1]]).decode("utf-8")
+
+
+def is_randomized(mac: str) -> bool:
+    """True for locally administered addresses, e.g. private Wi-Fi MACs of phones."""
+    digits = "".join(c for c in (mac or "")[:3] if c not in ":-. ")[:2]
+    try:
+        return bool(int(digits, 16) & 0x02)
+    except ValueError:
+        return False
+
+
+def load(path: str = DATA_FILE) -> OUIIndex | None:
+    """Load the bundled index once (blocking I/O; call from an executor in Home Assistant).
+
+    Returns None if the data file is missing or unreadable.
+    """
+    global _index
+    with _lock:
+        if _index is None:
+            try:
+                with gzip.open(path, "rb") as fh:
+                    _index = OUIIndex(fh.read())
+            except (OSError, ValueError, struct.error):
+                _index = False
+        return _index or None
+
+
+def vendor(mac: str) -> str | None:
+    """Vendor of a MAC address, loading the index on first use."""
+    if is_randomized(mac):
+        return None
+    index = _index if _index is not None else load()
+    return index.vendor(mac) if index else None
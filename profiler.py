@@ -0,0 +1,185 @@
+"""Time-boxed profiling of one gateway's hot paths, switched on by a service call.
+
+While a session runs, methods of the live objects are replaced by wrappers on
+the instances only (the classes, other gateways and other integrations are
+untouched) and restored afterwards:
+
+- synchronous paths (client `login`/`fetch` in executor threads, including
+  the HTTP round trip and JSON decoding, and the coordinator's listener fan-out
+  to `_handle_coordinator_update` on the event loop) are timed per call and
+  profiled with cProfile into a single pstats file;
+- coroutines (the coordinator update) are timed end to end, which includes
+  executor and request-queue waits that cProfile cannot see.
+
+Since Python 3.12 cProfile is built on sys.monitoring: only one profiler can be
+active in the whole interpreter and it sees every thread. The session then runs
+one profiler for its whole window (covering the entire process) instead of one
+per call, which would collect other threads' calls and fail for concurrent calls.
+"""
+
+import cProfile
+import functools
+import io
+import logging
+import pstats
+import sys
+import threading
+import time
+from datetime import datetime
+
+_LOGGER = logging.getLogger(__name__)
+
+TOP_FUNCTIONS = 30
+
+# cProfile profiles every thread with one interpreter-wide profiler (sys.monitoring)
+INTERPRETER_WIDE = sys.version_info >= (3, 12)
+
+
+class _Timing:
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, elapsed: float):
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+
+
+class ProfileSession:
+    """Collects merged cProfile stats and wall-clock timings from wrapped methods."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._patched: list[tuple[object, str, object, bool]] = []
+        self._profile: cProfile.Profile | None = None
+        self.stats: pstats.Stats | None = None
+        self.timings: dict[str, _Timing] = {}
+        self.started = time.time()
+        self.finished = None
+
+    def _record(self, label: str, elapsed: float, profile: cProfile.Profile | None = None):
+        with self._lock:
+            self.timings.setdefault(label, _Timing()).add(elapsed)
+        if profile is not None:
+            self._record_profile(profile)
+
+    def _record_profile(self, profile: cProfile.Profile):
+        with self._lock:
+            if self.stats is None:
+                self.stats = pstats.Stats(profile)
+            else:
+                self.stats.add(profile)
+
+    def _patch(self, obj, attr: str, wrapper):
+        had_own = attr in vars(obj)
+        self._patched.append((obj, attr, vars(obj).get(attr), had_own))
+        setattr(obj, attr, wrapper)
+
+    def start(self):
+        """Enable the session-wide profiler where cProfile is interpreter-wide."""
+        if not INTERPRETER_WIDE:
+            return
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler (e.g. HA's profiler integration) is active
+            _LOGGER.warning("[TCGA][PROFILE] Another profiler is active; collecting timings only")
+            return
+        self._profile = profile
+
+    def wrap_sync(self, obj, attr: str, label: str):
+        """Time and profile every call of obj.attr (a plain method) while the session runs."""
+        func = getattr(obj, attr)
+
+        @functools.wraps(func)
+        def _wrapper(*args, **kwargs):
+            # The session-wide profiler sees the call already; before 3.12 cProfile
+            # profiles one thread per profiler, so each call gets its own and
+            # nested wrapped calls are only timed
+            if INTERPRETER_WIDE or getattr(self._local, "active", False):
+                started = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self._record(label, time.perf_counter() - started)
+            profile = cProfile.Profile()
+            self._local.active = True
+            started = time.perf_counter()
+            try:
+                profile.enable()
+            except ValueError:
+                # Another profiler (e.g. HA's profiler integration) owns this thread
+                profile = None
+            try:
+                return func(*args, **kwargs)
+            finally:
+                if profile is not None:
+                    profile.disable()
+                self._local.active = False
+                self._record(label, time.perf_counter() - started, profile)
+
+        self._patch(obj, attr, _wrapper)
+
+    def wrap_async(self, obj, attr: str, label: str):
+        """Time every await of obj.attr (a coroutine function) while the session runs."""
+        func = getattr(obj, attr)
+
+        @functools.wraps(func)
+        async def _wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                self._record(label, time.perf_counter() - started)
+
+        self._patch(obj, attr, _wrapper)
+
+    def restore(self):
+        """Put the original methods back and stop the session-wide profiler (idempotent)."""
+        while self._patched:
+            obj, attr, original, had_own = self._patched.pop()
+            if had_own:
+                setattr(obj, attr, original)
+            else:
+                delattr(obj, attr)
+        if self._profile is not None:
+            self._profile.disable()
+            self._record_profile(self._profile)
+            self._profile = None
+        if self.finished is None:
+            self.finished = time.time()
+
+    def summary(self, header: str = "") -> str:
+        out = io.StringIO()
+        if header:
+            out.write(header.rstrip() + "\n\n")
+        duration = (self.finished or time.time()) - self.started
+        out.write(f"Profiled {duration:.1f}s from {datetime.fromtimestamp(self.started).isoformat(timespec='seconds')}\n\n")
+        out.write(f"{'Path':40} {'Calls':>7} {'Total ms':>10} {'Avg ms':>9} {'Max ms':>9}\n")
+        with self._lock:
+            for label, timing in sorted(self.timings.items(), key=lambda item: -item[1].total):
+                avg = timing.total / timing.count if timing.count else 0.0
+                out.write(f"{label:40} {timing.count:>7} {timing.total * 1000:>10.1f} {avg * 1000:>9.1f} {timing.max * 1000:>9.1f}\n")
+            if self.stats is None:
+                out.write("\nNo profiled calls.\n")
+                return out.getvalue()
+            out.write(f"\nTop {TOP_FUNCTIONS} functions by cumulative time:\n")
+            self.stats.stream = out
+            self.stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+            out.write(f"\nTop {TOP_FUNCTIONS} functions by own time:\n")
+            self.stats.sort_stats(pstats.SortKey.TIME).print_stats(TOP_FUNCTIONS)
+        return out.getvalue()
+
+    def write(self, prof_path: str, summary_path: str, header: str = ""):
+        """Write the merged pstats file and the text summary (blocking I/O)."""
+        with self._lock:
+            if self.stats is not None:
+                self.stats.dump_stats(prof_path)
+        with open(summary_path, "w", encoding="utf-8") as fh:
+            fh.write(self.summary(header))
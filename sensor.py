@@ -1,12 +1,18 @@
+import asyncio
 import logging
-from datetime import timedelta
+from datetime import datetime, timedelta
 
-from homeassistant.components.sensor import SensorEntity
-from homeassistant.const import CONF_USERNAME, CONF_PASSWORD, CONF_HOST
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
+from homeassistant.const import CONF_HOST, PERCENTAGE, UnitOfInformation, UnitOfTime
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
 from homeassistant.helpers.event import async_track_time_interval
 
-from .const import DOMAIN
-from .technicolor_cga import TechnicolorCGA
+from .const import DATA_SNAPSHOTS, DOMAIN, SIGNAL_GATEWAY_RESUMED, SIGNAL_LEVELS_UPDATED
+from .health import HealthMonitor
+from .session import async_ensure_login
+from .snapshot import SNAPSHOT_ENDPOINTS
+from .technicolor_cga import CircuitOpenError, FetchResult, GatewaySuspendedError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,8 +23,12 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up the Technicolor CGA sensor from a config entry."""
     _LOGGER.debug("Setting up Technicolor CGA sensor")
 
-    username = config_entry.data[CONF_USERNAME]
-    password = config_entry.data[CONF_PASSWORD]
+    # Share the client (and its session) logged in by __init__ with the tracker platform
+    technicolor_cga = hass.data[DOMAIN].get(config_entry.entry_id)
+    if technicolor_cga is None:
+        _LOGGER.error("Technicolor CGA instance not found in hass.data for entry %s", config_entry.entry_id)
+        return
+
     host = config_entry.data[CONF_HOST]
 
     # Determine scan interval from options
@@ -27,18 +37,43 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         scan_seconds = 10
     scan_interval = timedelta(seconds=scan_seconds)
 
-    try:
-        technicolor_cga = TechnicolorCGA(username, password, host)
-        await hass.async_add_executor_job(technicolor_cga.login)
-    except Exception as e:
-        _LOGGER.error(f"Failed to log in to Technicolor CGA: {e}")
-        return
-
     sensors = []
+    snapshot = hass.data[DATA_SNAPSHOTS][config_entry.entry_id]
+
+    # Sensors are created from the last known data when there is some; only
+    # endpoints never seen before are fetched (as one batch) before setup continues
+    initial = {name: snapshot.get(name) for name in ("system", "dhcp")}
+    missing = [name for name, data in initial.items() if data is None]
+    restored = {name for name in SNAPSHOT_ENDPOINTS if snapshot.get(name) is not None}
+
+    # Failures shared by several sensors (login, a failed endpoint) are logged here,
+    # once per tick and as an error only when they start; the sensors log at debug level.
+    failing = set()
+
+    def _log_failure(name, err):
+        message = "Failed to log in to Technicolor CGA" if name is None else f"Failed to fetch {name} data from Technicolor CGA"
+        if isinstance(err, (CircuitOpenError, GatewaySuspendedError)) or name in failing:
+            _LOGGER.debug(f"{message}: {err}")
+        else:
+            _LOGGER.error(f"{message}: {err}")
+        failing.add(name)
+
+    if missing:
+        try:
+            await async_ensure_login(hass, config_entry.entry_id, technicolor_cga)
+            results = await hass.async_add_executor_job(technicolor_cga.fetch_many, missing)
+        except Exception as e:
+            _log_failure(None, e)
+            results = {}
+        for name, result in results.items():
+            if result.ok:
+                initial[name] = result.data
+                snapshot.update(name, result.data)
+            else:
+                _log_failure(name, result.error)
 
     # Add system sensor
-    try:
-        system_data = await hass.async_add_executor_job(technicolor_cga.system)
+    if initial["system"] is not None:
         sensors.append(
             TechnicolorCGASystemSensor(
                 technicolor_cga,
@@ -46,16 +81,13 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
                 config_entry.entry_id,
                 host,
                 "Technicolor CGA System Status",
-                system_data,
+                initial["system"],
             )
         )
-    except Exception as e:
-        _LOGGER.error(f"Failed to fetch system data from Technicolor CGA: {e}")
 
     # Add DHCP sensors
-    try:
-        dhcp_data = await hass.async_add_executor_job(technicolor_cga.dhcp)
-        for key in dhcp_data.keys():
+    if initial["dhcp"] is not None:
+        for key in initial["dhcp"].keys():
             sensors.append(
                 TechnicolorCGADHCPSensor(
                     technicolor_cga,
@@ -66,8 +98,22 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
                     key,
                 )
             )
-    except Exception as e:
-        _LOGGER.error(f"Failed to fetch DHCP data from Technicolor CGA: {e}")
+
+    # Gateway health sensors share one monitor fed from the system data
+    monitor = HealthMonitor()
+    for sensor_cls in HEALTH_SENSORS:
+        sensors.append(sensor_cls(technicolor_cga, hass, config_entry.entry_id, host, monitor))
+
+    # Request queue diagnostics; reads the client's counters, no gateway request
+    sensors.append(
+        TechnicolorCGARequestQueueSensor(
+            technicolor_cga,
+            hass,
+            config_entry.entry_id,
+            host,
+            "Technicolor CGA Request Queue",
+        )
+    )
 
     # Add host sensor
     try:
@@ -97,21 +143,128 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     except Exception as e:
         _LOGGER.error(f"Failed to create Delta sensor: {e}")
 
-    async_add_entities(sensors, True)
+    # Show the last known values, marked stale, until the first refresh below replaces them
+    for sensor in sensors:
+        if sensor.restorable and sensor.endpoint in restored:
+            _restore(sensor, snapshot)
+
+    async_add_entities(sensors)
     _LOGGER.debug("Technicolor CGA sensors added (with device_info)")
 
-    # Schedule periodic refreshes with write-back
-    async def _refresh_entity(now, entity: SensorEntity):
-        await entity.async_update()
-        entity.async_write_ha_state()
+    # One refresh per gateway and tick, with write-back. All endpoints the sensors
+    # need are fetched as one batch; a tick is skipped while the previous one is
+    # still running, so slow or unreachable gateways cannot pile up executor jobs.
+    # The modem levels ride along and are handed to the DOCSIS anomaly sensor.
+    refresh_lock = asyncio.Lock()
+    endpoints = tuple(dict.fromkeys([*(sensor.endpoint for sensor in sensors if sensor.endpoint), "levels"]))
+
+    async def _async_refresh_all(now=None):
+        # No requests while the gateway reboots; the resume signal refreshes everything
+        if technicolor_cga.suspended:
+            return
+        if refresh_lock.locked():
+            _LOGGER.debug("Previous Technicolor CGA refresh still running; skipping tick")
+            return
+        async with refresh_lock:
+            error = None
+            if technicolor_cga.breaker.is_open:
+                error = CircuitOpenError("circuit open")
+            else:
+                # The first tick logs in when setup restored a snapshot instead; retried every tick until it works
+                try:
+                    await async_ensure_login(hass, config_entry.entry_id, technicolor_cga)
+                except Exception as e:
+                    error = e
+            if error is not None:
+                _log_failure(None, error)
+                for sensor in sensors:
+                    if sensor.endpoint:
+                        _mark_unavailable(sensor, error)
+            else:
+                failing.discard(None)
+                results = await hass.async_add_executor_job(technicolor_cga.fetch_many, endpoints)
+                for name, result in results.items():
+                    if result.ok:
+                        failing.discard(name)
+                    else:
+                        _log_failure(name, result.error)
+                for sensor in sensors:
+                    if sensor.endpoint:
+                        _apply_result(sensor, results[sensor.endpoint])
+                for name in ("system", "dhcp"):
+                    if name in results and results[name].ok:
+                        snapshot.update(name, results[name].data)
+            levels = FetchResult("levels", error=error) if error is not None else results["levels"]
+            async_dispatcher_send(hass, SIGNAL_LEVELS_UPDATED.format(config_entry.entry_id), levels)
+            for sensor in sensors:
+                if not sensor.endpoint:
+                    sensor._apply(None)
+            for sensor in sensors:
+                if sensor.hass is not None and sensor.entity_id:
+                    sensor.async_write_ha_state()
+
+    config_entry.async_on_unload(async_track_time_interval(hass, _async_refresh_all, scan_interval))
+    # First live values in the background; startup does not wait for the gateway
+    config_entry.async_create_background_task(hass, _async_refresh_all(), f"{DOMAIN} sensor refresh {config_entry.entry_id}")
+
+    @callback
+    def _on_gateway_resumed():
+        hass.async_create_task(_async_refresh_all())
+
+    config_entry.async_on_unload(
+        async_dispatcher_connect(hass, SIGNAL_GATEWAY_RESUMED.format(config_entry.entry_id), _on_gateway_resumed)
+    )
+
+
+def _apply_result(entity: SensorEntity, result):
+    """Apply a FetchResult of the entity's endpoint, tracking availability."""
+    if not result.ok:
+        _mark_unavailable(entity, result.error)
+        return
+    try:
+        entity._apply(result.data)
+    except Exception as e:
+        # Specific to this sensor, so logged here; once, when it becomes unavailable
+        if entity._attr_available:
+            _LOGGER.error(f"Error updating {entity.name}: {e}")
+        _mark_unavailable(entity, e)
+        return
+    entity._attr_available = True
+    entity._stale_since = None
+
+
+def _restore(entity: SensorEntity, snapshot):
+    """Apply the snapshot data of the entity's endpoint and mark the entity stale."""
+    try:
+        entity._apply(snapshot.get(entity.endpoint))
+    except Exception as e:
+        _LOGGER.debug(f"Could not restore {entity.name} from snapshot: {e}")
+        return
+    entity._stale_since = snapshot.saved_at(entity.endpoint)
+
+
+def _stale_attributes(entity: SensorEntity, attributes: dict) -> dict:
+    """Attributes plus `stale`/`stale_since` while the entity shows restored data."""
+    if entity._stale_since is None:
+        return attributes
+    return {**attributes, "stale": True, "stale_since": entity._stale_since}
 
-    for sensor in sensors:
-        async_track_time_interval(hass, lambda now, ent=sensor: hass.async_create_task(_refresh_entity(now, ent)), scan_interval)
+
+def _mark_unavailable(entity: SensorEntity, err: Exception):
+    """Mark a sensor unavailable; the platform has already logged the shared failure."""
+    entity._attr_available = False
+    _LOGGER.debug(f"{entity.name} unavailable: {err}")
 
 
 class TechnicolorCGABaseSensor(SensorEntity):
     """Base class for Technicolor CGA sensors with device_info."""
 
+    endpoint = "aDev"
+    # Whether the last known endpoint data may be shown at startup
+    restorable = True
+    # Updated only by the platform's batched tick, never polled per entity
+    _attr_should_poll = False
+
     def __init__(self, technicolor_cga, hass, config_entry_id, host, name):
         """Initialize the sensor."""
         self.technicolor_cga = technicolor_cga
@@ -121,6 +274,8 @@ class TechnicolorCGABaseSensor(SensorEntity):
         self._attr_name = name
         self._state = None
         self._attributes = {}
+        # Snapshot time while showing restored data, None once live data arrived
+        self._stale_since = None
         # Optional fields that the system sensor may fill later
         self._model = None
         self._sw_version = None
@@ -137,14 +292,14 @@ class TechnicolorCGABaseSensor(SensorEntity):
         return self._attr_name
 
     @property
-    def state(self):
-        """Return the state of the sensor."""
+    def native_value(self):
+        """Return the value of the sensor; SensorEntity.state applies unit conversion."""
         return self._state
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes of the sensor."""
-        return self._attributes
+        return _stale_attributes(self, self._attributes)
 
     @property
     def device_info(self):
@@ -166,19 +321,24 @@ class TechnicolorCGABaseSensor(SensorEntity):
             info["sw_version"] = self._sw_version
         return info
 
-    async def async_update(self):
-        """Fetch new state data for the sensor."""
-        raise NotImplementedError("Subclasses must implement async_update")
+    # Registered TechnicolorCGA endpoint this sensor is built from
+    endpoint: str
+
+    def _apply(self, data: dict):
+        """Update state from the endpoint data."""
+        raise NotImplementedError("Subclasses must implement _apply")
 
 
 class TechnicolorCGASystemSensor(TechnicolorCGABaseSensor):
     """System sensor for Technicolor CGA."""
 
+    endpoint = "system"
+
     def __init__(self, technicolor_cga, hass, config_entry_id, host, name, system_data):
         super().__init__(technicolor_cga, hass, config_entry_id, host, name)
-        self._apply_system_data(system_data)
+        self._apply(system_data)
 
-    def _apply_system_data(self, system_data: dict):
+    def _apply(self, system_data: dict):
         self._state = system_data.get("CMStatus", "Unknown")
         # Pick common keys for model / firmware if available
         self._model = system_data.get("ModelName") or system_data.get("Model")
@@ -189,42 +349,31 @@ class TechnicolorCGASystemSensor(TechnicolorCGABaseSensor):
         )
         self._attributes = {k: v for k, v in system_data.items() if k != "CMStatus"}
 
-    async def async_update(self):
-        try:
-            system_data = await self.hass.async_add_executor_job(self.technicolor_cga.system)
-            self._apply_system_data(system_data)
-        except Exception as e:
-            _LOGGER.error(f"Error updating {self.name}: {e}")
-
 
 class TechnicolorCGADHCPSensor(TechnicolorCGABaseSensor):
     """DHCP sensor for Technicolor CGA."""
 
+    endpoint = "dhcp"
+
     def __init__(self, technicolor_cga, hass, config_entry_id, host, name, attribute):
         super().__init__(technicolor_cga, hass, config_entry_id, host, name)
         self._attribute = attribute
 
-    async def async_update(self):
-        try:
-            dhcp_data = await self.hass.async_add_executor_job(self.technicolor_cga.dhcp)
-            self._state = dhcp_data.get(self._attribute, "Unknown")
-        except Exception as e:
-            _LOGGER.error(f"Error updating {self.name}: {e}")
+    def _apply(self, dhcp_data: dict):
+        self._state = dhcp_data.get(self._attribute, "Unknown")
 
 
 class TechnicolorCGAHostSensor(TechnicolorCGABaseSensor):
     """Host sensor for Technicolor CGA."""
 
+    endpoint = "aDev"
+
     def __init__(self, technicolor_cga, hass, config_entry_id, host, name):
         super().__init__(technicolor_cga, hass, config_entry_id, host, name)
 
-    async def async_update(self):
-        try:
-            host_data = await self.hass.async_add_executor_job(self.technicolor_cga.aDev)
-            self._state = len(host_data.get("hostTbl", []))
-            self._attributes = host_data
-        except Exception as e:
-            _LOGGER.error(f"Error updating {self.name}: {e}")
+    def _apply(self, host_data: dict):
+        self._state = len(host_data.get("hostTbl", []))
+        self._attributes = host_data
 
 
 class TechnicolorCGAHostDeltaSensor(SensorEntity):
@@ -234,6 +383,10 @@ class TechnicolorCGAHostDeltaSensor(SensorEntity):
     here to group this entity under the same device in the registry.
     """
 
+    endpoint = "aDev"
+    restorable = True
+    _attr_should_poll = False
+
     def __init__(self, technicolor_cga, hass, config_entry_id, host, name):
         """Initialize the sensor."""
         self.technicolor_cga = technicolor_cga
@@ -242,6 +395,7 @@ class TechnicolorCGAHostDeltaSensor(SensorEntity):
         self._host = host
         self._attr_name = name
         self._state = None
+        self._stale_since = None
         self._missing_devices = []
         self._known_devices = {}  # dynamically learned known devices
         _LOGGER.debug(f"{name} Sensor initialized (host: {host})")
@@ -281,14 +435,14 @@ class TechnicolorCGAHostDeltaSensor(SensorEntity):
         return self._attr_name
 
     @property
-    def state(self):
-        """Return the state of the sensor."""
+    def native_value(self):
+        """Return the value of the sensor."""
         return len(self._missing_devices)
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes of the sensor."""
-        return {
+        return _stale_attributes(self, {
             "missing_devices": sorted(
                 self._missing_devices, key=lambda x: self._ip_sort_key(x["last_ip"])
             ),
@@ -299,7 +453,7 @@ class TechnicolorCGAHostDeltaSensor(SensorEntity):
                 ],
                 key=lambda x: self._ip_sort_key(x["last_ip"]),
             ),
-        }
+        })
 
     @property
     def device_info(self):
@@ -319,47 +473,155 @@ class TechnicolorCGAHostDeltaSensor(SensorEntity):
             # Handle invalid IPs gracefully by placing them at the end
             return (999, 999, 999, 999)
 
-    async def async_update(self):
-        """Fetch new state data for the sensor."""
-        _LOGGER.debug(f"Updating {self._attr_name} sensor")
-        try:
-            # Fetch host table
-            host_data = await self.hass.async_add_executor_job(self.technicolor_cga.aDev)
-            current_devices = {
-                host["physaddress"]: {
-                    "ip": host.get("ipaddress", "Unknown"),
-                    "hostname": host.get("hostname", "Unknown"),
-                    "active": host.get("active", "false"),
-                }
-                for host in host_data.get("hostTbl", [])
+    def _apply(self, host_data: dict):
+        """Recompute missing devices from a host table."""
+        current_devices = {
+            host["physaddress"]: {
+                "ip": host.get("ipaddress", "Unknown"),
+                "hostname": host.get("hostname", "Unknown"),
+                "active": host.get("active", "false"),
             }
+            for host in host_data.get("hostTbl", [])
+        }
 
-            # Update known devices
-            for mac, details in current_devices.items():
-                self._known_devices[mac] = details
-
-            # Determine missing or inactive devices
-            self._missing_devices = []
-            for mac, details in self._known_devices.items():
-                if mac not in current_devices:
-                    self._missing_devices.append(
-                        {
-                            "mac": mac,
-                            "last_ip": details["ip"],
-                            "hostname": details["hostname"],
-                            "status": "missing",
-                        }
-                    )
-                elif current_devices[mac]["active"] == "false":
-                    self._missing_devices.append(
-                        {
-                            "mac": mac,
-                            "last_ip": current_devices[mac]["ip"],
-                            "hostname": current_devices[mac]["hostname"],
-                            "status": "inactive",
-                        }
-                    )
-
-            _LOGGER.debug(f"{self._attr_name} sensor state updated: {self._missing_devices}")
-        except Exception as e:
-            _LOGGER.error(f"Error updating {self._attr_name} sensor: {e}")
+        # Update known devices
+        for mac, details in current_devices.items():
+            self._known_devices[mac] = details
+
+        # Determine missing or inactive devices
+        self._missing_devices = []
+        for mac, details in self._known_devices.items():
+            if mac not in current_devices:
+                self._missing_devices.append(
+                    {
+                        "mac": mac,
+                        "last_ip": details["ip"],
+                        "hostname": details["hostname"],
+                        "status": "missing",
+                    }
+                )
+            elif current_devices[mac]["active"] == "false":
+                self._missing_devices.append(
+                    {
+                        "mac": mac,
+                        "last_ip": current_devices[mac]["ip"],
+                        "hostname": current_devices[mac]["hostname"],
+                        "status": "inactive",
+                    }
+                )
+
+        _LOGGER.debug(f"{self._attr_name} sensor state updated: {self._missing_devices}")
+
+
+class TechnicolorCGAHealthSensor(TechnicolorCGABaseSensor):
+    """Numeric gateway health value derived from system() via a shared HealthMonitor."""
+
+    endpoint = "system"
+    # Health values are derived from live samples only (a restored uptime would look like a reboot)
+    restorable = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    health_name = None
+
+    def __init__(self, technicolor_cga, hass, config_entry_id, host, monitor: HealthMonitor):
+        super().__init__(technicolor_cga, hass, config_entry_id, host, f"Technicolor CGA {self.health_name}")
+        self._monitor = monitor
+
+    def _apply(self, system_data: dict):
+        # Every health sensor gets the same dict per tick; the monitor samples it once
+        self._monitor.update(system_data, reboot_requested_at=self.technicolor_cga.last_reboot_request)
+        self._apply_health(self._monitor)
+
+    def _apply_health(self, monitor: HealthMonitor):
+        raise NotImplementedError("Subclasses must implement _apply_health")
+
+
+class TechnicolorCGAUptimeSensor(TechnicolorCGAHealthSensor):
+    """Gateway uptime in seconds."""
+
+    health_name = "Uptime"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def _apply_health(self, monitor: HealthMonitor):
+        self._state = monitor.uptime
+        self._attributes = {"boot_time": _timestamp(monitor.boot_time)}
+
+
+class TechnicolorCGAMemoryFreeSensor(TechnicolorCGAHealthSensor):
+    """Free gateway memory in KiB, with the total as attribute."""
+
+    health_name = "Memory Free"
+    _attr_device_class = SensorDeviceClass.DATA_SIZE
+    _attr_native_unit_of_measurement = UnitOfInformation.KIBIBYTES
+
+    def _apply_health(self, monitor: HealthMonitor):
+        self._state = None if monitor.mem_free is None else int(monitor.mem_free)
+        self._attributes = {"memory_total_kb": None if monitor.mem_total is None else int(monitor.mem_total)}
+
+
+class TechnicolorCGAMemoryUsedSensor(TechnicolorCGAHealthSensor):
+    """Used gateway memory in percent of total."""
+
+    health_name = "Memory Used"
+    _attr_native_unit_of_measurement = PERCENTAGE
+
+    def _apply_health(self, monitor: HealthMonitor):
+        used = monitor.mem_used_pct
+        self._state = None if used is None else round(used, 1)
+
+
+class TechnicolorCGAMemoryTrendSensor(TechnicolorCGAHealthSensor):
+    """Free-memory trend in KiB per hour over the monitor window; negative means shrinking."""
+
+    health_name = "Memory Trend"
+    _attr_native_unit_of_measurement = "KiB/h"
+
+    def _apply_health(self, monitor: HealthMonitor):
+        slope = monitor.mem_free_slope
+        self._state = None if slope is None else round(slope, 1)
+        self._attributes = {
+            "leak_suspected": monitor.leak_suspected,
+            "window_hours": round(monitor.trend_span_hours, 2),
+        }
+
+
+class TechnicolorCGARebootSensor(TechnicolorCGAHealthSensor):
+    """Unexpected gateway reboots (uptime going backwards) since Home Assistant started."""
+
+    health_name = "Unexpected Reboots"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def _apply_health(self, monitor: HealthMonitor):
+        self._state = monitor.unexpected_reboots
+        self._attributes = {
+            "reboots_total": monitor.reboots,
+            "last_reboot": _timestamp(monitor.last_reboot),
+            "last_reboot_expected": monitor.last_reboot_expected,
+        }
+
+
+class TechnicolorCGARequestQueueSensor(TechnicolorCGABaseSensor):
+    """Requests waiting for the gateway, with per-priority wait times as attributes."""
+
+    endpoint = None
+    restorable = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def _apply(self, data=None):
+        stats = self.technicolor_cga.queue.stats()
+        self._state = stats.pop("depth")
+        self._attributes = stats
+
+
+HEALTH_SENSORS = (
+    TechnicolorCGAUptimeSensor,
+    TechnicolorCGAMemoryFreeSensor,
+    TechnicolorCGAMemoryUsedSensor,
+    TechnicolorCGAMemoryTrendSensor,
+    TechnicolorCGARebootSensor,
+)
+
+
+def _timestamp(epoch: float | None) -> str | None:
+    return None if epoch is None else datetime.fromtimestamp(epoch).isoformat(timespec="seconds")
@@ -0,0 +1,191 @@
+import asyncio
+import logging
+import os
+from datetime import datetime
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_DURATION,
+    DATA_COORDINATORS,
+    DOMAIN,
+    PROFILE_DEFAULT_SECONDS,
+    PROFILE_MAX_SECONDS,
+    REBOOT_DOWN_PROBE_SECONDS,
+    REBOOT_DOWN_TIMEOUT_SECONDS,
+    REBOOT_PROBE_INITIAL_SECONDS,
+    REBOOT_PROBE_MAX_SECONDS,
+    REBOOT_TIMEOUT_SECONDS,
+    SERVICE_PROFILE,
+    SERVICE_REBOOT,
+    SIGNAL_GATEWAY_RESUMED,
+)
+from .profiler import ProfileSession
+from .session import async_save_session
+
+_LOGGER = logging.getLogger(__name__)
+
+REBOOT_SCHEMA = vol.Schema({vol.Optional(ATTR_CONFIG_ENTRY_ID): str})
+PROFILE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): str,
+    vol.Optional(ATTR_DURATION, default=PROFILE_DEFAULT_SECONDS): vol.All(
+        vol.Coerce(float), vol.Range(min=1, max=PROFILE_MAX_SECONDS)
+    ),
+})
+
+# Entry ids with a profiling session in progress
+_PROFILING: set[str] = set()
+
+
+def _resolve_entry_id(hass: HomeAssistant, call: ServiceCall) -> str:
+    """Return the targeted entry; it may be omitted when only one gateway is configured."""
+    clients = hass.data.get(DOMAIN, {})
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    if entry_id is None:
+        if len(clients) != 1:
+            raise HomeAssistantError(f"{ATTR_CONFIG_ENTRY_ID} is required when {len(clients)} gateways are configured")
+        return next(iter(clients))
+    if entry_id not in clients:
+        raise HomeAssistantError(f"Technicolor CGA entry {entry_id} is not loaded")
+    return entry_id
+
+
+async def _async_wait_for_gateway(hass: HomeAssistant, entry_id: str, technicolor_cga):
+    """Wait for the gateway to go down and answer again, re-login once and resume all polling."""
+    loop = asyncio.get_running_loop()
+    delay = REBOOT_PROBE_INITIAL_SECONDS
+    cancelled = False
+    try:
+        # The web server keeps answering for a while after the reset request
+        down_deadline = loop.time() + REBOOT_DOWN_TIMEOUT_SECONDS
+        while await hass.async_add_executor_job(technicolor_cga.ping):
+            if loop.time() >= down_deadline:
+                _LOGGER.warning(
+                    "[TCGA][REBOOT] Gateway %s still answering %ss after the reboot request; resuming polling",
+                    technicolor_cga.server, REBOOT_DOWN_TIMEOUT_SECONDS,
+                )
+                return
+            await asyncio.sleep(REBOOT_DOWN_PROBE_SECONDS)
+        _LOGGER.debug("[TCGA][REBOOT] Gateway %s went down", technicolor_cga.server)
+
+        deadline = loop.time() + REBOOT_TIMEOUT_SECONDS
+        while loop.time() < deadline:
+            if await hass.async_add_executor_job(technicolor_cga.ping):
+                # Reachable again: do not let failures from before the reboot block the login
+                technicolor_cga.breaker.record_success()
+                try:
+                    await hass.async_add_executor_job(technicolor_cga.login)
+                    await async_save_session(hass, entry_id, technicolor_cga)
+                    _LOGGER.info("[TCGA][REBOOT] Gateway %s is back; resuming polling", technicolor_cga.server)
+                    return
+                except Exception as err:
+                    # Web UI answers before the login handler is ready
+                    _LOGGER.debug("[TCGA][REBOOT] Gateway answers but login failed yet: %s", err)
+            _LOGGER.debug("[TCGA][REBOOT] Gateway %s not ready; next probe in %ss", technicolor_cga.server, delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, REBOOT_PROBE_MAX_SECONDS)
+        _LOGGER.warning(
+            "[TCGA][REBOOT] Gateway %s did not come back within %ss; resuming polling anyway",
+            technicolor_cga.server, REBOOT_TIMEOUT_SECONDS,
+        )
+    except asyncio.CancelledError:
+        # Entry unloaded: nothing is left to resume
+        cancelled = True
+        raise
+    finally:
+        technicolor_cga.suspended = False
+        if not cancelled:
+            # Every platform refreshes on this signal, so all endpoints resume together
+            async_dispatcher_send(hass, SIGNAL_GATEWAY_RESUMED.format(entry_id))
+
+
+async def async_reboot_gateway(hass: HomeAssistant, entry_id: str):
+    """Reboot the gateway, suspending all polling until it is reachable again."""
+    technicolor_cga = hass.data[DOMAIN][entry_id]
+    if technicolor_cga.suspended:
+        raise HomeAssistantError("Gateway reboot already in progress")
+
+    technicolor_cga.suspended = True
+    try:
+        accepted = await hass.async_add_executor_job(technicolor_cga.reboot)
+    except Exception as err:
+        # The gateway may drop the connection while going down; keep watching
+        _LOGGER.warning("[TCGA][REBOOT] No clean reply to reboot request (%s); assuming it is rebooting", err)
+        accepted = True
+    if not accepted:
+        technicolor_cga.suspended = False
+        raise HomeAssistantError("Gateway refused the reboot request")
+
+    _LOGGER.info("[TCGA][REBOOT] Reboot requested for %s; polling suspended", technicolor_cga.server)
+    # Tied to the entry, so unloading it cancels the watcher
+    hass.config_entries.async_get_entry(entry_id).async_create_background_task(
+        hass,
+        _async_wait_for_gateway(hass, entry_id, technicolor_cga),
+        f"{DOMAIN} reboot watcher {entry_id}",
+    )
+
+
+async def async_profile_gateway(hass: HomeAssistant, entry_id: str, duration: float):
+    """Profile the entry's coordinator update, listener fan-out and client calls for `duration` seconds."""
+    if entry_id in _PROFILING:
+        raise HomeAssistantError("Profiling already running for this gateway")
+    technicolor_cga = hass.data[DOMAIN][entry_id]
+    coordinator = hass.data.get(DATA_COORDINATORS, {}).get(entry_id)
+
+    profile = ProfileSession()
+    profile.wrap_sync(technicolor_cga, "login", "client.login")
+    profile.wrap_sync(technicolor_cga, "fetch", "client.fetch (request + decode)")
+    if coordinator is not None:
+        profile.wrap_async(coordinator, "update_method", "coordinator.update (wall)")
+        profile.wrap_sync(coordinator, "async_update_listeners", "coordinator.listeners (fan-out)")
+    queue_before = technicolor_cga.queue.stats()["waits"]
+    _PROFILING.add(entry_id)
+    profile.start()
+    _LOGGER.info("[TCGA][PROFILE] Profiling %s for %ss", technicolor_cga.server, duration)
+
+    async def _finish():
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            profile.restore()
+            _PROFILING.discard(entry_id)
+        header = [f"Technicolor CGA profile for {technicolor_cga.server} (entry {entry_id})", "", "Request queue waits during the session:"]
+        for name, waits in technicolor_cga.queue.stats()["waits"].items():
+            count = waits["count"] - queue_before[name]["count"]
+            header.append(f"  {name:10} {count} new waits, max {waits['max_ms']} ms overall")
+        base = hass.config.path(f"{DOMAIN}_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        await hass.async_add_executor_job(profile.write, f"{base}.prof", f"{base}.txt", "\n".join(header))
+        _LOGGER.info(
+            "[TCGA][PROFILE] Wrote %s.prof (pstats; open with snakeviz or flameprof) and %s.txt",
+            os.path.basename(base), os.path.basename(base),
+        )
+
+    hass.async_create_background_task(_finish(), name=f"{DOMAIN} profiler {entry_id}")
+
+
+async def async_setup_services(hass: HomeAssistant):
+    """Register integration services once, for all config entries."""
+    if hass.services.has_service(DOMAIN, SERVICE_REBOOT):
+        return
+
+    async def _handle_reboot(call: ServiceCall):
+        await async_reboot_gateway(hass, _resolve_entry_id(hass, call))
+
+    async def _handle_profile(call: ServiceCall):
+        await async_profile_gateway(hass, _resolve_entry_id(hass, call), call.data[ATTR_DURATION])
+
+    hass.services.async_register(DOMAIN, SERVICE_REBOOT, _handle_reboot, schema=REBOOT_SCHEMA)
+    hass.services.async_register(DOMAIN, SERVICE_PROFILE, _handle_profile, schema=PROFILE_SCHEMA)
+
+
+def async_unload_services(hass: HomeAssistant):
+    """Remove services once the last config entry is unloaded."""
+    if hass.data.get(DOMAIN):
+        return
+    hass.services.async_remove(DOMAIN, SERVICE_REBOOT)
+    hass.services.async_remove(DOMAIN, SERVICE_PROFILE)
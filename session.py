@@ -0,0 +1,89 @@
+"""Gateway session persistence, so restarts can skip the full login sequence.
+
+The auth cookie and CSRF token are kept in Home Assistant's private storage
+(`.storage`, readable by the owner only), together with the gateway URL and
+username they belong to.
+"""
+
+import asyncio
+import logging
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import STORAGE_KEY_SESSION, STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _LoginState:
+    __slots__ = ("lock", "attempts", "error")
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.attempts = 0
+        self.error = None
+
+
+# Per entry id; shared by the platforms that log in lazily on their first refresh
+_LOGINS: dict[str, _LoginState] = {}
+
+
+def _store(hass: HomeAssistant, entry_id: str) -> Store:
+    return Store(hass, STORAGE_VERSION, STORAGE_KEY_SESSION.format(entry_id), private=True)
+
+
+async def async_login(hass: HomeAssistant, entry_id: str, technicolor_cga):
+    """Resume the saved session if the gateway still accepts it, otherwise log in and save the new one."""
+    store = _store(hass, entry_id)
+    saved = await store.async_load()
+    if saved and saved.get("server") == technicolor_cga.server and saved.get("username") == technicolor_cga.username:
+        if await hass.async_add_executor_job(technicolor_cga.resume_session, saved):
+            _LOGGER.info("[TCGA] Reusing saved session for router=%s", technicolor_cga.server)
+            return
+        _LOGGER.debug("[TCGA] Saved session for router=%s expired; logging in", technicolor_cga.server)
+
+    await hass.async_add_executor_job(technicolor_cga.login)
+    await async_save_session(hass, entry_id, technicolor_cga)
+
+
+async def async_ensure_login(hass: HomeAssistant, entry_id: str, technicolor_cga):
+    """Log in (via async_login) unless the client already is; raises if that fails.
+
+    Platforms call this before each refresh, so a gateway that is down at startup
+    is logged into on a later tick. Callers that waited while another platform's
+    attempt failed get that error instead of trying again in the same tick.
+    """
+    if technicolor_cga.logged:
+        return
+    state = _LOGINS.setdefault(entry_id, _LoginState())
+    attempts = state.attempts
+    async with state.lock:
+        if technicolor_cga.logged:
+            return
+        if state.attempts != attempts and state.error is not None:
+            raise state.error
+        state.attempts += 1
+        try:
+            await async_login(hass, entry_id, technicolor_cga)
+        except Exception as err:
+            state.error = err
+            raise
+        state.error = None
+        _LOGGER.info("[TCGA] Login successful to router=%s", technicolor_cga.server)
+
+
+def forget_login(entry_id: str):
+    _LOGINS.pop(entry_id, None)
+
+
+async def async_save_session(hass: HomeAssistant, entry_id: str, technicolor_cga):
+    """Save the client's current session (after any successful login)."""
+    state = technicolor_cga.export_session()
+    if state is None:
+        return
+    await _store(hass, entry_id).async_save({"server": technicolor_cga.server, "username": technicolor_cga.username, **state})
+
+
+async def async_remove_session(hass: HomeAssistant, entry_id: str):
+    await _store(hass, entry_id).async_remove()
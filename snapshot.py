@@ -0,0 +1,94 @@
+"""Last known gateway data, so entities can be restored at startup without waiting for the gateway.
+
+The latest successful host table (aDev), system and dhcp replies are kept in
+Home Assistant's private storage (`.storage`, readable by the owner only).
+Host rows are reduced to the fields the entities use. Writes are throttled to
+one per SNAPSHOT_SAVE_DELAY seconds with the newest data, and flushed when
+Home Assistant stops.
+"""
+
+import logging
+from datetime import datetime
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import SNAPSHOT_SAVE_DELAY, STORAGE_KEY_SNAPSHOT, STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_ENDPOINTS = ("aDev", "system", "dhcp")
+
+# hostTbl fields read by the tracker and host sensors
+_HOST_FIELDS = ("physaddress", "ipaddress", "hostname", "active", "Active", "Status", "status")
+
+
+def _store(hass: HomeAssistant, entry_id: str) -> Store:
+    return Store(hass, STORAGE_VERSION, STORAGE_KEY_SNAPSHOT.format(entry_id), private=True)
+
+
+def _compact_hosts(data: dict) -> dict:
+    return {
+        "hostTbl": [
+            {key: dev[key] for key in _HOST_FIELDS if key in dev}
+            for dev in data.get("hostTbl", []) or []
+        ]
+    }
+
+
+class GatewaySnapshot:
+    """Per-entry snapshot: {endpoint: {"data": ..., "saved_at": iso timestamp}}."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str):
+        self._store = _store(hass, entry_id)
+        self._endpoints: dict[str, dict] = {}
+        self._save_pending = False
+
+    async def async_load(self):
+        saved = await self._store.async_load() or {}
+        self._endpoints = {
+            name: saved[name]
+            for name in SNAPSHOT_ENDPOINTS
+            if isinstance(saved.get(name), dict) and isinstance(saved[name].get("data"), dict)
+        }
+        if self._endpoints:
+            _LOGGER.debug("[TCGA][SNAPSHOT] Loaded %s", {name: e.get("saved_at") for name, e in self._endpoints.items()})
+
+    def __len__(self):
+        return len(self._endpoints)
+
+    def get(self, name: str) -> dict | None:
+        """Last known data of an endpoint, or None."""
+        entry = self._endpoints.get(name)
+        return None if entry is None else entry["data"]
+
+    def saved_at(self, name: str) -> str | None:
+        entry = self._endpoints.get(name)
+        return None if entry is None else entry.get("saved_at")
+
+    @callback
+    def update(self, name: str, data: dict):
+        """Remember the latest successful reply of an endpoint and schedule a write."""
+        if name not in SNAPSHOT_ENDPOINTS or not isinstance(data, dict):
+            return
+        if name == "aDev":
+            data = _compact_hosts(data)
+        self._endpoints[name] = {"data": data, "saved_at": datetime.now().isoformat(timespec="seconds")}
+        # async_delay_save postpones a pending write on every call; only arm it once per delay
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict:
+        self._save_pending = False
+        return self._endpoints
+
+    async def async_flush(self):
+        """Write a pending update now (on unload), so no delayed write outlives the entry."""
+        if self._save_pending:
+            await self._store.async_save(self._data_to_save())
+
+
+async def async_remove_snapshot(hass: HomeAssistant, entry_id: str):
+    await _store(hass, entry_id).async_remove()
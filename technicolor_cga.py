@@ -1,19 +1,311 @@
 import requests
 import hashlib
+import logging
+import heapq
+import itertools
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable
+
+try:
+    from .capture import CaptureRecorder, ReplayAdapter
+except ImportError:  # standalone use (test.py)
+    from capture import CaptureRecorder, ReplayAdapter
+
+_LOGGER = logging.getLogger(__name__)
+
+class GatewaySuspendedError(RuntimeError):
+    """Raised instead of sending requests while the gateway is rebooting."""
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of sending requests while the gateway is considered unreachable."""
+
+
+class CircuitBreaker:
+    """Per-gateway circuit breaker (closed -> open -> half_open -> closed).
+
+    After `failure_threshold` consecutive transport failures the circuit opens
+    and requests fail fast. Once the backoff has elapsed a single trial request
+    is let through (half_open); success closes the circuit, failure reopens it
+    with the backoff doubled up to `max_backoff`.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=3, base_backoff=30.0, max_backoff=900.0):
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.state = self.CLOSED
+        self.failures = 0
+        self.backoff = base_backoff
+        self.retry_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """True while requests are being rejected (open and backoff not yet elapsed)."""
+        with self._lock:
+            return self.state == self.OPEN and time.monotonic() < self.retry_at
+
+    def retry_in(self) -> float:
+        return max(0.0, self.retry_at - time.monotonic())
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() >= self.retry_at:
+                self.state = self.HALF_OPEN
+                return True
+            # Open, or half-open with the trial request still in flight
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self.state != self.CLOSED:
+                _LOGGER.info("[TCGA][CIRCUIT] Gateway reachable again; circuit closed")
+            self.state = self.CLOSED
+            self.failures = 0
+            self.backoff = self.base_backoff
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN:
+                self.backoff = min(self.backoff * 2, self.max_backoff)
+            elif self.state == self.CLOSED and self.failures < self.failure_threshold:
+                return
+            elif self.state == self.OPEN:
+                return
+            self.state = self.OPEN
+            self.retry_at = time.monotonic() + self.backoff
+            _LOGGER.warning(
+                "[TCGA][CIRCUIT] Gateway unreachable after %d failures; circuit open for %.0fs",
+                self.failures, self.backoff,
+            )
+
+
+# Request priority classes (lower goes first)
+PRIORITY_PRESENCE = 0
+PRIORITY_LEVELS = 1
+PRIORITY_STATIC = 2
+PRIORITY_NAMES = {PRIORITY_PRESENCE: "presence", PRIORITY_LEVELS: "levels", PRIORITY_STATIC: "static"}
+
+
+class RequestQueue:
+    """Per-gateway admission queue: at most `limit` requests in flight, by priority.
+
+    Waiting requests are admitted lowest priority value first and FIFO within
+    a class, so presence polls overtake queued modem-level or static-data
+    requests. Queue depth and wait times are kept per class.
+    """
+
+    def __init__(self, limit=1):
+        self.limit = max(1, int(limit))
+        self.in_flight = 0
+        self.max_depth = 0
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._waits = {p: {"count": 0, "total": 0.0, "max": 0.0, "last": 0.0} for p in PRIORITY_NAMES}
+
+    @property
+    def depth(self) -> int:
+        """Requests currently waiting for a slot."""
+        return len(self._heap)
+
+    def acquire(self, priority=PRIORITY_STATIC) -> float:
+        """Block until admitted; returns the time waited in seconds."""
+        ticket = (priority, next(self._seq))
+        started = time.monotonic()
+        with self._cond:
+            heapq.heappush(self._heap, ticket)
+            self.max_depth = max(self.max_depth, len(self._heap))
+            while self.in_flight >= self.limit or self._heap[0] != ticket:
+                self._cond.wait()
+            heapq.heappop(self._heap)
+            self.in_flight += 1
+            waited = time.monotonic() - started
+            stats = self._waits.setdefault(priority, {"count": 0, "total": 0.0, "max": 0.0, "last": 0.0})
+            stats["count"] += 1
+            stats["total"] += waited
+            stats["max"] = max(stats["max"], waited)
+            stats["last"] = waited
+            # The next ticket may be admissible too when limit > 1
+            self._cond.notify_all()
+        return waited
+
+    def release(self):
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        """Depth and per-class wait times (milliseconds) for diagnostics."""
+        with self._cond:
+            waits = {}
+            for priority, stats in self._waits.items():
+                name = PRIORITY_NAMES.get(priority, str(priority))
+                waits[name] = {
+                    "count": stats["count"],
+                    "avg_ms": round(stats["total"] / stats["count"] * 1000.0, 1) if stats["count"] else None,
+                    "max_ms": round(stats["max"] * 1000.0, 1),
+                    "last_ms": round(stats["last"] * 1000.0, 1),
+                }
+            return {
+                "depth": len(self._heap),
+                "max_depth": self.max_depth,
+                "in_flight": self.in_flight,
+                "limit": self.limit,
+                "waits": waits,
+            }
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """A router API target, the fields requested from it and how to normalize the reply."""
+
+    name: str
+    target: str
+    fields: tuple
+    parse: Callable[[dict], Any]
+    priority: int = PRIORITY_STATIC
+
+
+@dataclass
+class FetchResult:
+    """Outcome of fetching one registered endpoint within a batch."""
+
+    name: str
+    data: Any = None
+    error: Exception | None = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+ENDPOINTS: dict[str, Endpoint] = {}
+
+
+def register_endpoint(name, target, fields, parse=None, priority=PRIORITY_STATIC):
+    """Add (or replace) an endpoint that fetch()/fetch_many() can serve by name."""
+    ENDPOINTS[name] = Endpoint(name, target, tuple(dict.fromkeys(fields)), parse or _parse_dict, priority)
+    return ENDPOINTS[name]
+
+
+def _parse_dict(data):
+    return data if isinstance(data, dict) else {}
+
+
+def _parse_hosts(data):
+    data = _parse_dict(data)
+    data["hostTbl"] = data.get("hostTbl") or []
+    return data
+
+
+register_endpoint("system", "system", [
+    "HardwareVersion",
+    "FirmwareName",
+    "CMMACAddress",
+    "MACAddressRT",
+    "UpTime",
+    "LocalTime",
+    "LanMode",
+    "ModelName",
+    "CMStatus",
+    "Manufacturer",
+    "SerialNumber",
+    "SoftwareVersion",
+    "BootloaderVersion",
+    "CoreVersion",
+    "FirmwareBuildTime",
+    "ProcessorSpeed",
+    "Hardware",
+    "MemTotal",
+    "MemFree",
+])
+
+register_endpoint("levels", "modem", ["exUSTbl", "exDSTbl", "USTbl", "DSTbl", "ErrTbl"], priority=PRIORITY_LEVELS)
+
+register_endpoint("dhcp", "dhcp/v4/1", [
+    "IPAddressRT",
+    "SubnetMaskRT",
+    "IPAddressGW",
+    "DNSTblRT",
+    "PoolEnable",
+    "WanAddressMode",
+])
+
+register_endpoint("aDev", "host", ["hostTbl", "LanMode", "MixedMode", "LanPortMode"], _parse_hosts, PRIORITY_PRESENCE)
+
+
+class _Flight:
+    """A request in progress that concurrent callers of the same endpoint wait for."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
 
 class TechnicolorCGA:
-    def __init__(self, username, password, router="192.168.0.1"):
+    def __init__(self, username, password, router="192.168.0.1", capture_path=None, replay_path=None, replay_speed=1.0, max_concurrent=1):
         self.server = f"http://{router}"
         self.username = username
         self.password = password
 
         self.logged = False
+        # Set while the gateway reboots; call() then fails fast without touching the network
+        self.suspended = False
+
+        self.timeout = 10
+        # time.time() of the last reboot() request, to tell planned reboots from crashes
+        self.last_reboot_request = None
+        self.breaker = CircuitBreaker()
+        # The CGA web server copes badly with parallel API calls; serialize by default
+        self.queue = RequestQueue(max_concurrent)
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        self._pool = None
+        self._pool_lock = threading.Lock()
 
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/105.0.0.0 Safari/537.36"})
         self.session.headers.update({"X-Requested-With": "XMLHttpRequest"})
 
+        # Offline replay of a capture file instead of talking to the router
+        if replay_path:
+            self.session.mount("http://", ReplayAdapter(replay_path, self.session.cookies, speed=replay_speed))
+
+        # Record every request/response pair (credentials redacted)
+        self.recorder = None
+        self._owns_recorder = False
+        if capture_path:
+            self.attach_recorder(CaptureRecorder(capture_path, server=self.server))
+            self._owns_recorder = True
+
+    def attach_recorder(self, recorder):
+        """Record this client's traffic with an existing (possibly shared) CaptureRecorder."""
+        self.recorder = recorder
+        self.session.hooks["response"].append(recorder.record)
+
+    def close(self):
+        # A shared recorder belongs to whoever attached it and may still be in use
+        if self.recorder is not None and self._owns_recorder:
+            self.recorder.close()
+        self.recorder = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+        self.session.close()
+
     def endpoint(self, target, options):
         opts = ",".join(options)
         now = int(time.time())
@@ -23,10 +315,63 @@ class TechnicolorCGA:
 
         return f"{self.server}/api/v1/{target}/{opts}?_={now}"
 
-    def call(self, endpoint):
-        request = self.session.get(endpoint)
-        response = request.json()
-        return response["data"]
+    def _send(self, method, endpoint, priority=PRIORITY_PRESENCE, **kwargs):
+        """Send a request through the request queue and circuit breaker.
+
+        Transport errors count as breaker failures. Login and other session
+        requests default to the highest priority.
+        """
+        self.queue.acquire(priority)
+        try:
+            # Checked after queueing so waiting requests fail fast once the circuit opens
+            if not self.breaker.allow():
+                raise CircuitOpenError(f"gateway unreachable; next attempt in {self.breaker.retry_in():.0f}s")
+            try:
+                request = self.session.request(method, endpoint, timeout=self.timeout, **kwargs)
+            except requests.RequestException:
+                self.breaker.record_failure()
+                raise
+            self.breaker.record_success()
+            return request
+        finally:
+            self.queue.release()
+
+    def _single_flight(self, key, fetch):
+        """Run fetch() unless the same endpoint is already being fetched; then share that result."""
+        with self._inflight_lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fetch()
+            return flight.result
+        except Exception as err:
+            flight.error = err
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+            flight.done.set()
+
+    def call(self, endpoint, priority=PRIORITY_STATIC):
+        if self.suspended:
+            raise GatewaySuspendedError("gateway is rebooting")
+
+        def _fetch():
+            request = self._send("GET", endpoint, priority)
+            response = request.json()
+            return response["data"]
+
+        # The "_=<timestamp>" cache buster differs per call; key on the path
+        return self._single_flight(endpoint.split("?", 1)[0], _fetch)
 
     def challenge(self, password, salt):
         bpass = password.encode('utf-8')
@@ -41,7 +386,7 @@ class TechnicolorCGA:
         }
 
         endpoint = self.endpoint("session", ["login"])
-        request = self.session.post(endpoint, data=data)
+        request = self._send("POST", endpoint, data=data)
         response = request.json()
 
         challenge = self.challenge(self.password, response['salt'])
@@ -53,14 +398,14 @@ class TechnicolorCGA:
         }
 
         endpoint = self.endpoint("session", ["login"])
-        request = self.session.post(endpoint, data=data)
+        request = self._send("POST", endpoint, data=data)
         response = request.json()
 
         if response['error'] == 'ok':
             self.session.headers.update({'X-CSRF-TOKEN': self.session.cookies['auth']})
 
             endpoint = self.endpoint("session", ["menu"])
-            self.session.get(endpoint)
+            self._send("GET", endpoint)
 
             self.logged = True
 
@@ -68,70 +413,96 @@ class TechnicolorCGA:
 
         raise RuntimeError("invalid credentials")
 
+    def export_session(self):
+        """Cookies and CSRF token of the current login (None before login()), for resume_session()."""
+        if not self.logged:
+            return None
+        return {
+            "cookies": requests.utils.dict_from_cookiejar(self.session.cookies),
+            "csrf_token": self.session.headers.get("X-CSRF-TOKEN"),
+        }
+
+    def resume_session(self, state):
+        """Reuse a session saved by export_session() instead of a full login().
+
+        One small data request checks that the gateway still accepts it; if not,
+        the restored credentials are dropped and False is returned.
+        """
+        if not state or not state.get("cookies") or not state.get("csrf_token"):
+            return False
+        self.session.cookies.update(state["cookies"])
+        self.session.headers.update({"X-CSRF-TOKEN": state["csrf_token"]})
+
+        request = self._send("GET", self.endpoint("system", ["CMStatus"]))
+        try:
+            response = request.json()
+            valid = request.status_code == 200 and response.get("error") == "ok" and "data" in response
+        except ValueError:
+            valid = False
+
+        if not valid:
+            self.session.cookies.clear()
+            self.session.headers.pop("X-CSRF-TOKEN", None)
+        self.logged = valid
+        return valid
+
+    def fetch(self, name):
+        """Fetch one registered endpoint and return its parsed data."""
+        spec = ENDPOINTS[name]
+        endpoint = self.endpoint(spec.target, spec.fields)
+        return spec.parse(self.call(endpoint, spec.priority))
+
+    def _fetch_result(self, name):
+        started = time.monotonic()
+        try:
+            return FetchResult(name, data=self.fetch(name), elapsed=time.monotonic() - started)
+        except Exception as err:
+            return FetchResult(name, error=err, elapsed=time.monotonic() - started)
+
+    def fetch_many(self, names):
+        """Fetch several registered endpoints as one concurrent batch.
+
+        Returns {name: FetchResult}; a failing endpoint does not affect the others.
+        """
+        names = list(dict.fromkeys(names))
+        if len(names) == 1:
+            return {names[0]: self._fetch_result(names[0])}
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=len(ENDPOINTS), thread_name_prefix="tcga")
+        futures = {name: self._pool.submit(self._fetch_result, name) for name in names}
+        return {name: future.result() for name, future in futures.items()}
+
     def system(self):
-        options = [
-            "HardwareVersion",
-            "FirmwareName",
-            "CMMACAddress",
-            "MACAddressRT",
-            "UpTime",
-            "LocalTime",
-            "LanMode",
-            "ModelName",
-            "CMStatus",
-            "ModelName",
-            "Manufacturer",
-            "SerialNumber",
-            "SoftwareVersion",
-            "BootloaderVersion",
-            "CoreVersion",
-            "FirmwareBuildTime",
-            "ProcessorSpeed",
-            "CMMACAddress",
-            "Hardware",
-            "MemTotal",
-            "MemFree"
-        ]
-
-        endpoint = self.endpoint("system", options)
-        return self.call(endpoint)
+        return self.fetch("system")
 
     def levels(self):
-        options = [
-            "exUSTbl",
-            "exDSTbl",
-            "USTbl",
-            "DSTbl",
-            "ErrTbl"
-        ]
-
-        endpoint = self.endpoint("modem", options)
-        return self.call(endpoint)
+        return self.fetch("levels")
 
     def dhcp(self):
-        options = [
-            "IPAddressRT",
-            "SubnetMaskRT",
-            "IPAddressGW",
-            "DNSTblRT",
-            "PoolEnable",
-            "WanAddressMode"
-        ]
-
-        endpoint = self.endpoint("dhcp/v4/1", options)
-        return self.call(endpoint)
+        return self.fetch("dhcp")
 
     def aDev(self):
-        options = [ "hostTbl", "LanMode" , "MixedMode" , "LanPortMode" ]
+        return self.fetch("aDev")
 
-        endpoint = self.endpoint("host", options)
-        return self.call(endpoint)
+    def ping(self, timeout=3):
+        """Cheap reachability probe: True once the web server answers without a server error."""
+        try:
+            request = self.session.get(f"{self.server}/", timeout=timeout)
+        except requests.RequestException:
+            return False
+        return request.status_code < 500
 
     def reboot(self):
         endpoint = self.endpoint("reset", [])
 
         data = {"reboot": "Router,Wifi,VoIP,Dect,MoCA"}
-        request = self.session.post(endpoint, data=data)
+        self.last_reboot_request = time.time()
+        self.queue.acquire(PRIORITY_PRESENCE)
+        try:
+            request = self.session.post(endpoint, data=data, timeout=self.timeout)
+        finally:
+            self.queue.release()
         response = request.json()
 
         return response['error'] == 'ok'
@@ -5,17 +5,54 @@ as reported by the Technicolor CGA router.
 
 Usage:
   python3 test.py --username <user> --password <pass> [--host 192.168.0.1]
+  python3 test.py --username <user> --password <pass> --bench [--duration 60] [--rate 2] [--concurrency 1] [--json]
+  python3 test.py --username <user> --password <pass> --watch [--interval 10] [--json]
+  python3 test.py --fleet gateways.json [--workers 32] [--timeout 10] [--json]
+  python3 test.py ... [--capture traffic.jsonl.gz | --replay traffic.jsonl.gz [--replay-speed 10]]
 
 This script uses the same router client as the Home Assistant integration
 (technicolor_cga.TechnicolorCGA), logs in, fetches the host table (aDev),
-and prints a readable table including online/offline status.
+and prints a readable table including online/offline status and the MAC
+vendor from the bundled OUI index (oui.py).
+
+With --bench it instead repeatedly calls login/system/levels/dhcp/aDev at the
+given rate and concurrency for the given duration and reports per-endpoint
+latency percentiles, error rates and payload sizes.
+
+With --watch it keeps one session, polls aDev every --interval seconds and
+prints only changes (joined, left, IP or hostname changed) with timestamps,
+or one JSON object per change with --json. An expired session is renewed with
+a single re-login; an unreachable gateway is retried on the next poll.
+
+With --fleet it audits every gateway listed in a JSON file (same format as
+exporter.py --gateways) with a bounded pool of --workers threads: login, host
+table, system() and levels() per gateway, aggregated into one report with
+per-gateway timings and failure details.
+
+--capture records all router traffic (credentials redacted) to a JSONL file
+(gzip when ending in .gz); --replay serves such a file back without network.
 """
 
 import argparse
+import json
+import math
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-from technicolor_cga import TechnicolorCGA
+import hosts
+from capture import CaptureRecorder
+from docsis import level_summary
+from exporter import load_gateways
+from health import parse_uptime
+from oui import is_randomized, vendor
+from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
+
+from technicolor_cga import CircuitBreaker, TechnicolorCGA
+
+BENCH_ENDPOINTS = ("login", "system", "levels", "dhcp", "aDev")
 
 
 def _is_active(value) -> bool:
@@ -30,22 +67,475 @@ def _ip_sort_key(ip: str):
         return (999, 999, 999, 999)
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser(description="Print Technicolor CGA device network status")
-    parser.add_argument("--username", required=True, help="Router username")
-    parser.add_argument("--password", required=True, help="Router password")
-    parser.add_argument("--host", default="192.168.87.1", help="Router IP/host (default: 192.168.87.1)")
-
-    args = parser.parse_args()
+def _client(args, recorder: CaptureRecorder | None = None, gateway: dict | None = None) -> TechnicolorCGA:
+    gateway = gateway or {"username": args.username, "password": args.password, "host": args.host}
+    cli = TechnicolorCGA(
+        gateway["username"], gateway["password"], gateway["host"],
+        replay_path=args.replay, replay_speed=args.replay_speed,
+    )
+    if recorder is not None:
+        cli.attach_recorder(recorder)
+    return cli
 
-    cli = TechnicolorCGA(args.username, args.password, args.host)
 
+def _login(cli: TechnicolorCGA) -> bool:
     try:
         if not cli.login():
             print("Login failed (unexpected)", file=sys.stderr)
-            return 2
+            return False
     except Exception as e:
         print(f"Login error: {e}", file=sys.stderr)
+        return False
+    return True
+
+
+def _ms(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000.0, 1)
+
+
+def _percentile(values: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile of an already sorted list."""
+    if not values:
+        return None
+    rank = max(1, math.ceil(pct / 100.0 * len(values)))
+    return values[min(rank, len(values)) - 1]
+
+
+class _BenchStats:
+    """Thread-safe per-endpoint sample collector for --bench."""
+
+    def __init__(self, endpoints):
+        self._lock = threading.Lock()
+        self.samples = {name: {"latency": [], "bytes": [], "errors": 0, "last_error": None} for name in endpoints}
+
+    def add(self, name: str, latency: float, nbytes: int, error: Exception | None = None):
+        with self._lock:
+            entry = self.samples[name]
+            entry["latency"].append(latency)
+            entry["bytes"].append(nbytes)
+            if error is not None:
+                entry["errors"] += 1
+                entry["last_error"] = f"{type(error).__name__}: {error}"
+
+    def summary(self) -> dict:
+        result = {}
+        with self._lock:
+            for name, entry in self.samples.items():
+                latency = sorted(entry["latency"])
+                count = len(latency)
+                payload = entry["bytes"]
+                result[name] = {
+                    "requests": count,
+                    "errors": entry["errors"],
+                    "error_rate": round(entry["errors"] / count, 4) if count else None,
+                    "p50_ms": _ms(_percentile(latency, 50)),
+                    "p95_ms": _ms(_percentile(latency, 95)),
+                    "p99_ms": _ms(_percentile(latency, 99)),
+                    "max_ms": _ms(latency[-1] if latency else None),
+                    "avg_bytes": int(sum(payload) / len(payload)) if payload else None,
+                    "max_bytes": max(payload) if payload else None,
+                    "last_error": entry["last_error"],
+                }
+        return result
+
+
+def _run_bench(args, recorder: CaptureRecorder | None = None) -> int:
+    endpoints = [e.strip() for e in args.endpoints.split(",") if e.strip()]
+    unknown = [e for e in endpoints if e not in BENCH_ENDPOINTS]
+    if not endpoints or unknown:
+        print(f"Unknown endpoints: {', '.join(unknown) or '(none given)'}; choose from {', '.join(BENCH_ENDPOINTS)}", file=sys.stderr)
+        return 1
+
+    # One logged-in client (and HTTP session) per worker, like separate pollers would have
+    clients = []
+    try:
+        return _bench(args, recorder, endpoints, clients)
+    finally:
+        for cli in clients:
+            cli.close()
+
+
+def _bench(args, recorder: CaptureRecorder | None, endpoints: list, clients: list) -> int:
+    concurrency = max(1, args.concurrency)
+    for _ in range(concurrency):
+        cli = _client(args, recorder)
+        # Every request must reach the gateway: an open circuit would turn failures into instant errors
+        cli.breaker = CircuitBreaker(failure_threshold=math.inf)
+        clients.append(cli)
+        if not _login(cli):
+            return 2
+
+    model = firmware = None
+    try:
+        info = clients[0].system()
+        model = info.get("ModelName")
+        firmware = info.get("SoftwareVersion") or info.get("FirmwareName")
+    except Exception as e:
+        print(f"Failed to fetch system info: {e}", file=sys.stderr)
+
+    stats = _BenchStats(endpoints)
+    lock = threading.Lock()
+    schedule = {"next": time.monotonic(), "seq": 0}
+    interval = 1.0 / args.rate if args.rate > 0 else 0.0
+    deadline = time.monotonic() + args.duration
+
+    def _next_slot():
+        # Hand out (endpoint, start time) pairs so the aggregate rate is respected across workers
+        with lock:
+            seq = schedule["seq"]
+            schedule["seq"] += 1
+            start = schedule["next"]
+            schedule["next"] = max(start, time.monotonic()) + interval
+        return endpoints[seq % len(endpoints)], start
+
+    def _worker(cli: TechnicolorCGA):
+        received = {"bytes": 0}
+
+        def _count_bytes(response, *a, **kw):
+            received["bytes"] += len(response.content or b"")
+
+        cli.session.hooks["response"].append(_count_bytes)
+        while True:
+            name, start = _next_slot()
+            delay = start - time.monotonic()
+            if start >= deadline:
+                return
+            if delay > 0:
+                time.sleep(delay)
+            received["bytes"] = 0
+            error = None
+            t0 = time.perf_counter()
+            try:
+                getattr(cli, name)()
+            except Exception as e:
+                error = e
+            stats.add(name, time.perf_counter() - t0, received["bytes"], error)
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for cli in clients:
+            pool.submit(_worker, cli)
+    elapsed = time.monotonic() - started
+
+    summary = stats.summary()
+    total = sum(s["requests"] for s in summary.values())
+    report = {
+        "host": args.host,
+        "model": model,
+        "firmware": firmware,
+        "duration_s": round(elapsed, 1),
+        "target_rate": args.rate,
+        "concurrency": concurrency,
+        "requests": total,
+        "achieved_rate": round(total / elapsed, 2) if elapsed > 0 else None,
+        "endpoints": summary,
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    print(f"Technicolor CGA — Benchmark @ {ts} (host: {args.host})")
+    print(f"Model: {model or 'unknown'} — Firmware: {firmware or 'unknown'}")
+    print(
+        f"Duration: {report['duration_s']}s — Concurrency: {concurrency} — "
+        f"Target rate: {args.rate or 'unlimited'}/s — Achieved: {report['achieved_rate']}/s"
+    )
+    print("")
+
+    cols = ("Endpoint", "Reqs", "Errors", "Err%", "p50 ms", "p95 ms", "p99 ms", "Max ms", "Avg bytes")
+    widths = [10, 6, 7, 7, 9, 9, 9, 9, 10]
+    header = " ".join(s.ljust(w) for s, w in zip(cols, widths))
+    print(header)
+    print("-" * len(header))
+    for name in endpoints:
+        s = summary[name]
+        err_pct = "-" if s["error_rate"] is None else f"{s['error_rate'] * 100:.1f}"
+        values = (name, s["requests"], s["errors"], err_pct, s["p50_ms"], s["p95_ms"], s["p99_ms"], s["max_ms"], s["avg_bytes"])
+        print(" ".join(str("-" if v is None else v).ljust(w) for v, w in zip(values, widths)))
+
+    failures = [(name, s["last_error"]) for name, s in summary.items() if s["last_error"]]
+    if failures:
+        print("")
+        for name, err in failures:
+            print(f"Last error for {name}: {err}")
+
+    return 0
+
+
+def _watch_event(change: hosts.HostChange, ts: datetime) -> dict:
+    state = change.current or change.previous
+    event = {
+        "time": ts.isoformat(timespec="seconds"),
+        "event": change.kind,
+        "mac": change.mac,
+        "ip": state.ip,
+        "hostname": state.hostname,
+        "online": change.current.online if change.current else False,
+        "vendor": vendor(change.mac),
+        "randomized_mac": is_randomized(change.mac),
+    }
+    if change.kind == hosts.JOINED:
+        event["new"] = change.previous is None
+    elif change.kind == hosts.LEFT:
+        event["removed"] = change.current is None
+    elif change.kind == hosts.IP_CHANGED:
+        event["previous_ip"] = change.previous.ip
+    elif change.kind == hosts.HOSTNAME_CHANGED:
+        event["previous_hostname"] = change.previous.hostname
+    return event
+
+
+def _format_watch_event(event: dict) -> str:
+    detail = ""
+    if event["event"] == hosts.JOINED and event["new"]:
+        detail = "new host"
+    elif event["event"] == hosts.LEFT and event["removed"]:
+        detail = "removed from table"
+    elif event["event"] == hosts.IP_CHANGED:
+        detail = f"was {event['previous_ip']}"
+    elif event["event"] == hosts.HOSTNAME_CHANGED:
+        detail = f"was {event['previous_hostname'] or '(none)'}"
+    ts = event["time"].replace("T", " ")
+    name = event["hostname"] or event["vendor"] or ("(random MAC)" if event["randomized_mac"] else "unknown")
+    return f"{ts}  {event['event'].upper():17} {event['mac']:17} {event['ip'] or '-':15} {name[:32]:32} {detail}".rstrip()
+
+
+def _run_watch(args, recorder: CaptureRecorder | None = None) -> int:
+    cli = _client(args, recorder)
+    # The watch interval is the retry schedule; the breaker's backoff would silently skip polls
+    cli.breaker = CircuitBreaker(failure_threshold=math.inf)
+    if not _login(cli):
+        return 2
+
+    def _poll():
+        """Host table, renewing the session once if the gateway rejects it."""
+        try:
+            return cli.aDev().get("hostTbl", []) or []
+        except (RequestsConnectionError, Timeout):
+            # Transport failures are retried on the next interval, not by logging in
+            raise
+        except Exception as e:
+            # Expired sessions answer without "data" (or with a non-JSON error page, which
+            # requests reports as JSONDecodeError, itself a RequestException)
+            print(f"{datetime.now():%Y-%m-%d %H:%M:%S}  session rejected ({type(e).__name__}: {e}); logging in again", file=sys.stderr)
+            cli.login()
+            return cli.aDev().get("hostTbl", []) or []
+
+    previous = None
+    interval = max(1.0, args.interval)
+    try:
+        while True:
+            started = time.monotonic()
+            try:
+                current = hosts.snapshot(_poll())
+            except Exception as e:
+                print(f"{datetime.now():%Y-%m-%d %H:%M:%S}  poll failed: {type(e).__name__}: {e}", file=sys.stderr)
+            else:
+                if previous is None:
+                    online = sum(1 for state in current.values() if state.online)
+                    print(
+                        f"{datetime.now():%Y-%m-%d %H:%M:%S}  watching {args.host}: {len(current)} hosts, {online} online "
+                        f"(every {interval:g}s, Ctrl-C to stop)",
+                        file=sys.stderr if args.json else sys.stdout,
+                    )
+                else:
+                    now = datetime.now()
+                    for change in hosts.diff(previous, current):
+                        event = _watch_event(change, now)
+                        print(json.dumps(event) if args.json else _format_watch_event(event), flush=True)
+                previous = current
+            time.sleep(max(0.0, interval - (time.monotonic() - started)))
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        cli.close()
+
+
+FLEET_ENDPOINTS = ("aDev", "system", "levels")
+
+
+def _audit_gateway(args, gateway: dict, recorder: CaptureRecorder | None) -> dict:
+    """Login, host table, system and levels of one gateway; never raises."""
+    report = {"name": gateway["name"], "host": gateway["host"], "ok": False, "stage": "login", "error": None, "timings_ms": {}}
+    started = time.perf_counter()
+    cli = _client(args, recorder, gateway)
+    cli.timeout = args.timeout
+    try:
+        cli.login()
+        report["timings_ms"]["login"] = _ms(time.perf_counter() - started)
+        report["stage"] = "fetch"
+        results = cli.fetch_many(FLEET_ENDPOINTS)
+    except Exception as e:
+        report["error"] = f"{type(e).__name__}: {e}"
+        report["timings_ms"]["total"] = _ms(time.perf_counter() - started)
+        return report
+    finally:
+        cli.close()
+
+    for name, result in results.items():
+        report["timings_ms"][name] = _ms(result.elapsed)
+    failed = {name: f"{type(r.error).__name__}: {r.error}" for name, r in results.items() if not r.ok}
+
+    if results["aDev"].ok:
+        table = hosts.snapshot(results["aDev"].data.get("hostTbl"))
+        report["devices"] = len(table)
+        report["online"] = sum(1 for state in table.values() if state.online)
+    if results["system"].ok:
+        info = results["system"].data
+        report["model"] = info.get("ModelName") or info.get("Model")
+        report["firmware"] = info.get("SoftwareVersion") or info.get("SWVersion") or info.get("FirmwareVersion")
+        report["cm_status"] = info.get("CMStatus")
+        report["uptime_s"] = parse_uptime(info.get("UpTime"))
+    if results["levels"].ok:
+        report["levels"] = level_summary(results["levels"].data)
+
+    report["ok"] = not failed
+    report["stage"] = "done" if not failed else "fetch"
+    report["error"] = "; ".join(f"{name}: {err}" for name, err in failed.items()) or None
+    report["timings_ms"]["total"] = _ms(time.perf_counter() - started)
+    return report
+
+
+def _fleet_summary(reports: list[dict], elapsed: float, workers: int) -> dict:
+    totals = sorted(r["timings_ms"]["total"] for r in reports)
+    cm_status: dict[str, int] = {}
+    for r in reports:
+        if "cm_status" in r:
+            cm_status[str(r["cm_status"])] = cm_status.get(str(r["cm_status"]), 0) + 1
+    return {
+        "gateways": len(reports),
+        "ok": sum(1 for r in reports if r["ok"]),
+        "failed": sum(1 for r in reports if not r["ok"]),
+        "devices": sum(r.get("devices", 0) for r in reports),
+        "online": sum(r.get("online", 0) for r in reports),
+        "cm_status": cm_status,
+        "workers": workers,
+        "duration_s": round(elapsed, 2),
+        "gateway_p50_ms": _percentile(totals, 50),
+        "gateway_p95_ms": _percentile(totals, 95),
+        "gateway_max_ms": totals[-1] if totals else None,
+    }
+
+
+def _fmt_range(low, high) -> str:
+    if low is None:
+        return "-"
+    return f"{low:g}" if low == high else f"{low:g}..{high:g}"
+
+
+def _run_fleet(args, recorder: CaptureRecorder | None = None) -> int:
+    try:
+        gateways = load_gateways(args.fleet, args.username, args.password)
+    except (OSError, ValueError) as e:
+        print(f"Invalid fleet file: {e}", file=sys.stderr)
+        return 1
+    if not gateways:
+        print("Fleet file lists no gateways", file=sys.stderr)
+        return 1
+
+    workers = max(1, min(args.workers, len(gateways)))
+    started = time.monotonic()
+    # Gateways are independent; each worker runs one gateway's (serialized) requests at a time
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fleet") as pool:
+        reports = list(pool.map(lambda gw: _audit_gateway(args, gw, recorder), gateways))
+    elapsed = time.monotonic() - started
+    summary = _fleet_summary(reports, elapsed, workers)
+
+    if args.json:
+        print(json.dumps({"summary": summary, "gateways": reports}, indent=2))
+        return 0 if not summary["failed"] else 3
+
+    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    print(f"Technicolor CGA — Fleet sweep @ {ts} ({len(gateways)} gateways, {workers} workers)")
+    print("")
+    cols = ("Gateway", "Result", "Online/All", "CM status", "Model", "DS ch", "DS dBmV", "DS SNR min", "US ch", "US dBmV", "Uncorr", "ms")
+    widths = [22, 7, 11, 13, 12, 6, 12, 11, 6, 12, 8, 8]
+    header = " ".join(s.ljust(w) for s, w in zip(cols, widths))
+    print(header)
+    print("-" * len(header))
+    for r in sorted(reports, key=lambda r: (r["ok"], r["name"])):
+        lv = r.get("levels") or {}
+        ds = lv.get("downstream") or {}
+        us = lv.get("upstream") or {}
+        values = (
+            r["name"][:widths[0]],
+            "OK" if r["ok"] else "FAIL",
+            f"{r['online']}/{r['devices']}" if "devices" in r else "-",
+            str(r.get("cm_status") or "-")[:widths[3]],
+            str(r.get("model") or "-")[:widths[4]],
+            ds.get("channels", "-"),
+            _fmt_range(ds.get("power_min"), ds.get("power_max")),
+            "-" if ds.get("snr_min") is None else f"{ds['snr_min']:g}",
+            us.get("channels", "-"),
+            _fmt_range(us.get("power_min"), us.get("power_max")),
+            "-" if lv.get("uncorrectable") is None else int(lv["uncorrectable"]),
+            r["timings_ms"]["total"],
+        )
+        print(" ".join(str(v).ljust(w) for v, w in zip(values, widths)))
+
+    print("")
+    status = ", ".join(f"{k}: {v}" for k, v in sorted(summary["cm_status"].items())) or "-"
+    print(
+        f"Gateways: {summary['gateways']} — OK: {summary['ok']} — Failed: {summary['failed']} — "
+        f"Devices: {summary['devices']} ({summary['online']} online) — CM status: {status}"
+    )
+    print(
+        f"Sweep: {summary['duration_s']}s — per gateway p50 {summary['gateway_p50_ms']} ms, "
+        f"p95 {summary['gateway_p95_ms']} ms, max {summary['gateway_max_ms']} ms"
+    )
+    failures = [r for r in reports if not r["ok"]]
+    if failures:
+        print("")
+        for r in failures:
+            print(f"{r['name']} ({r['host']}) failed at {r['stage']}: {r['error']}")
+    return 0 if not failures else 3
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Print Technicolor CGA device network status")
+    parser.add_argument("--username", help="Router username (default for --fleet entries without one)")
+    parser.add_argument("--password", help="Router password (default for --fleet entries without one)")
+    parser.add_argument("--host", default="192.168.87.1", help="Router IP/host (default: 192.168.87.1)")
+    parser.add_argument("--bench", action="store_true", help="Run a load/latency benchmark instead of printing devices")
+    parser.add_argument("--duration", type=float, default=60.0, help="Benchmark duration in seconds (default: 60)")
+    parser.add_argument("--rate", type=float, default=1.0, help="Benchmark requests per second across all workers, 0 = unlimited (default: 1)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Benchmark worker count, each with its own session (default: 1)")
+    parser.add_argument("--endpoints", default=",".join(BENCH_ENDPOINTS), help=f"Benchmark endpoints, comma separated (default: {','.join(BENCH_ENDPOINTS)})")
+    parser.add_argument("--watch", action="store_true", help="Keep polling the host table and print only changes")
+    parser.add_argument("--interval", type=float, default=10.0, help="Watch poll interval in seconds (default: 10)")
+    parser.add_argument("--fleet", metavar="FILE", help="Audit all gateways in a JSON file concurrently instead of one --host")
+    parser.add_argument("--workers", type=int, default=32, help="Fleet worker threads, i.e. gateways audited at once (default: 32)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Fleet per-request timeout in seconds (default: 10)")
+    parser.add_argument("--json", action="store_true", help="Print benchmark results as JSON, or watch changes as newline-delimited JSON")
+    parser.add_argument("--capture", metavar="FILE", help="Record router traffic (credentials redacted) to a JSONL file; .gz compresses")
+    parser.add_argument("--replay", metavar="FILE", help="Serve router responses from a capture file instead of the network")
+    parser.add_argument("--replay-speed", type=float, default=1.0, help="Replay speed factor, 0 = no delays (default: 1 = recorded latency)")
+
+    args = parser.parse_args()
+    if not args.fleet and (not args.username or not args.password):
+        parser.error("--username and --password are required unless --fleet is used")
+
+    recorder = CaptureRecorder(args.capture, server=f"http://{args.host}") if args.capture else None
+    try:
+        return _run(args, recorder)
+    finally:
+        if recorder is not None:
+            recorder.close()
+
+
+def _run(args, recorder: CaptureRecorder | None) -> int:
+    if args.fleet:
+        return _run_fleet(args, recorder)
+    if args.bench:
+        return _run_bench(args, recorder)
+    if args.watch:
+        return _run_watch(args, recorder)
+
+    cli = _client(args, recorder)
+
+    if not _login(cli):
         return 2
 
     try:
@@ -54,20 +544,27 @@ def main() -> int:
         print(f"Failed to fetch host table: {e}", file=sys.stderr)
         return 3
 
-    hosts = data.get("hostTbl", []) or []
+    host_rows = data.get("hostTbl", []) or []
 
     # Normalize and sort by IP then hostname
     normalized = []
-    for dev in hosts:
+    for dev in host_rows:
         mac = dev.get("physaddress") or "unknown"
         ip = dev.get("ipaddress") or "unknown"
         hostname = dev.get("hostname") or "unknown"
+        if mac == "unknown":
+            maker = "unknown"
+        elif is_randomized(mac):
+            maker = "(random MAC)"
+        else:
+            maker = vendor(mac) or "unknown"
         active_raw = dev.get("active", "false")
         online = _is_active(active_raw)
         normalized.append({
             "mac": mac,
             "ip": ip,
             "hostname": hostname,
+            "vendor": maker,
             "active": str(active_raw),
             "online": online,
         })
@@ -79,8 +576,8 @@ def main() -> int:
     print("")
 
     # Table header
-    cols = ("MAC", "IP", "Hostname", "Active", "Status")
-    widths = [17, 15, 32, 8, 10]
+    cols = ("MAC", "IP", "Hostname", "Vendor", "Active", "Status")
+    widths = [17, 15, 32, 28, 8, 10]
     header = " ".join(s.ljust(w) for s, w in zip(cols, widths))
     print(header)
     print("-" * len(header))
@@ -94,8 +591,9 @@ def main() -> int:
             str(row["mac"]).ljust(widths[0]),
             str(row["ip"]).ljust(widths[1]),
             str(row["hostname"]).ljust(widths[2]),
-            str(row["active"]).ljust(widths[3]),
-            status.ljust(widths[4]),
+            str(row["vendor"])[:widths[3]].ljust(widths[3]),
+            str(row["active"]).ljust(widths[4]),
+            status.ljust(widths[5]),
         ])
         print(line)
 
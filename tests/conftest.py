@@ -0,0 +1,6 @@
+"""Make the integration's standalone modules importable without Home Assistant."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
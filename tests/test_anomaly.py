@@ -0,0 +1,76 @@
+import math
+import random
+
+import pytest
+
+from anomaly import LevelMonitor, _Window
+
+
+def _levels(power, snr=38.0, channel="1"):
+    return {"DSTbl": [{"ChannelID": channel, "PowerLevel": str(power), "SNRLevel": str(snr)}]}
+
+
+def test_window_matches_direct_statistics():
+    rng = random.Random(7)
+    window = _Window(8)
+    values = []
+    for _ in range(50):
+        value = rng.uniform(-5, 5)
+        window.add(value)
+        values = (values + [value])[-8:]
+        mean, std = window.mean_std()
+        expected_mean = sum(values) / len(values)
+        assert mean == pytest.approx(expected_mean)
+        assert std == pytest.approx(math.sqrt(sum((v - expected_mean) ** 2 for v in values) / len(values)), abs=1e-9)
+    assert window.count == 8
+
+
+def test_learns_before_flagging():
+    monitor = LevelMonitor(min_samples=10)
+    for _ in range(9):
+        assert monitor.update(_levels(3.0)) == []
+    # Only nine readings learned: a jump is not flagged yet
+    assert monitor.update(_levels(10.0)) == []
+    assert monitor.anomalies == {}
+
+
+def test_flags_once_and_clears():
+    monitor = LevelMonitor(min_samples=10, z_threshold=4.0, min_deviation=1.5)
+    for i in range(20):
+        monitor.update(_levels(3.0 + (0.1 if i % 2 else -0.1)))
+    started = monitor.update(_levels(9.0))
+    assert [(s.channel, s.metric, s.value) for s in started] == [("1", "power", 9.0)]
+    assert started[0].z >= 4.0
+    # Still anomalous on the next tick, but the event does not repeat
+    assert monitor.update(_levels(9.0)) == []
+    assert list(monitor.anomalies) == [("downstream", "sc-qam", "1", "power")]
+    monitor.update(_levels(3.0))
+    assert monitor.anomalies == {}
+
+
+def test_small_steps_on_stable_channels_are_not_anomalous():
+    monitor = LevelMonitor(min_samples=10, min_std=0.25, min_deviation=1.5)
+    for _ in range(30):
+        monitor.update(_levels(3.0))
+    # z is large against the 0.25 floor, but 1.0 dB is below min_deviation
+    assert monitor.update(_levels(4.0)) == []
+
+
+def test_lasting_change_becomes_normal():
+    monitor = LevelMonitor(window=20, min_samples=10)
+    for _ in range(20):
+        monitor.update(_levels(3.0))
+    assert monitor.update(_levels(8.0))
+    for _ in range(25):
+        monitor.update(_levels(8.0))
+    assert monitor.anomalies == {}
+
+
+def test_missing_channels_are_forgotten():
+    monitor = LevelMonitor(window=5)
+    monitor.update(_levels(3.0, channel="1"))
+    assert monitor.channels == 2  # power and SNR
+    for _ in range(5):
+        monitor.update(_levels(3.0, channel="2"))
+    assert monitor.channels == 2
+    assert {key[2] for key in monitor.latest} == {"2"}
@@ -0,0 +1,106 @@
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from capture import REDACTED, CaptureRecorder, ReplayAdapter
+
+
+class _Handler(BaseHTTPRequestHandler):
+    hits = 0
+
+    def do_GET(self):
+        type(self).hits += 1
+        self._reply({"path": self.path.split("?")[0], "hit": type(self).hits})
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._reply({"error": "ok"}, cookie="auth=secret-token")
+
+    def _reply(self, payload, cookie=None):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if cookie:
+            self.send_header("Set-Cookie", cookie)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.hits = 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _record(server, path):
+    recorder = CaptureRecorder(str(path), server=server)
+    with requests.Session() as session:
+        session.hooks["response"].append(recorder.record)
+        session.post(f"{server}/api/v1/session/login", data={"username": "admin", "password": "hunter2"})
+        first = session.get(f"{server}/api/v1/system/ModelName,UpTime?_=1700000000").json()
+        second = session.get(f"{server}/api/v1/system/ModelName,UpTime?_=1700000060").json()
+    recorder.close()
+    return first, second
+
+
+def _replay_session(path):
+    session = requests.Session()
+    session.mount("http://", ReplayAdapter(str(path), session.cookies, speed=0))
+    return session
+
+
+def test_capture_redacts_credentials_and_cache_busters(server, tmp_path):
+    path = tmp_path / "traffic.jsonl.gz"
+    _record(server, path)
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+        header, *records = [json.loads(line) for line in fh]
+    assert header["capture"] == 1
+    assert header["server"] == server
+    assert [record["key"] for record in records] == [
+        "POST /api/v1/session/login",
+        "GET /api/v1/system/ModelName,UpTime",
+        "GET /api/v1/system/ModelName,UpTime",
+    ]
+    assert records[0]["form"] == {"username": REDACTED, "password": REDACTED}
+    assert records[0]["cookies"] == ["auth"]
+    raw = gzip.decompress(path.read_bytes()).decode()
+    assert "hunter2" not in raw
+    assert "secret-token" not in raw
+
+
+def test_replay_serves_recorded_responses_in_order(server, tmp_path):
+    path = tmp_path / "traffic.jsonl"
+    first, second = _record(server, path)
+    with _replay_session(path) as session:
+        login = session.post("http://gateway/api/v1/session/login", data={"username": "x", "password": "y"})
+        assert login.json() == {"error": "ok"}
+        assert session.cookies.get("auth") == "replay-auth"
+        url = "http://gateway/api/v1/system/ModelName,UpTime?_=1"
+        assert session.get(url).json() == first
+        assert session.get(url).json() == second
+        # Exhausted recordings loop
+        assert session.get(url).json() == first
+
+
+def test_replay_matches_field_sets_regardless_of_order(server, tmp_path):
+    path = tmp_path / "traffic.jsonl"
+    first, _ = _record(server, path)
+    with _replay_session(path) as session:
+        response = session.get("http://gateway/api/v1/system/UpTime,ModelName,UpTime?_=2")
+        assert response.status_code == 200
+        assert response.json() == first
+        missing = session.get("http://gateway/api/v1/system/ModelName?_=3")
+        assert missing.status_code == 404
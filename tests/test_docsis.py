@@ -0,0 +1,74 @@
+import pytest
+
+from docsis import DOWNSTREAM, UPSTREAM, ChannelReading, channel_readings, level_summary, parse_number
+
+LEVELS = {
+    "DSTbl": [
+        {"ChannelID": "1", "PowerLevel": "3.1 dBmV", "SNRLevel": "38.6 dB", "Frequency": "570 MHz"},
+        {"ChannelID": 2, "PowerLevel": "-1.5", "SNRLevel": "40.2"},
+        {"PowerLevel": "9.9"},
+    ],
+    "exDSTbl": [{"ChannelID": "33", "Power": "1.0 dBmV", "MER": "41"}],
+    "USTbl": [{"ChannelId": "5", "PowerLevel": "44.5 dBmV", "Frequency": "36.2 MHz"}],
+    "exUSTbl": [{"__id": "9", "power": "", "Power": "n/a"}],
+    "ErrTbl": [
+        {"ChannelID": "1", "Unerrored": "1000", "Correctable": "12", "Uncorrectable": "3"},
+        {"ChannelID": "2", "Corrected": "8", "Uncorrected": "0"},
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("3.1 dBmV", 3.1),
+        ("-2", -2.0),
+        (7, 7.0),
+        ("570 MHz", 570e6),
+        ("36.2mhz", 36.2e6),
+        ("1 GHz", 1e9),
+        (True, None),
+        ("n/a", None),
+        (None, None),
+    ],
+)
+def test_parse_number(value, expected):
+    assert parse_number(value) == (None if expected is None else pytest.approx(expected))
+
+
+def test_channel_readings_flattens_every_table():
+    readings = channel_readings(LEVELS)
+    assert ChannelReading(DOWNSTREAM, "sc-qam", "1", "frequency", 570e6) in readings
+    assert ChannelReading(DOWNSTREAM, "sc-qam", "2", "power", -1.5) in readings
+    assert ChannelReading(DOWNSTREAM, "ofdm", "33", "snr", 41.0) in readings
+    assert ChannelReading(UPSTREAM, "sc-qam", "5", "power", 44.5) in readings
+    assert ChannelReading(DOWNSTREAM, "sc-qam", "1", "uncorrectable", 3.0) in readings
+    # Rows without a channel id and unparseable values are skipped
+    assert not [r for r in readings if r.value == 9.9]
+    assert not [r for r in readings if r.channel == "9"]
+
+
+def test_level_summary():
+    summary = level_summary(LEVELS)
+    assert summary["downstream"] == {
+        "channels": 3,
+        "power_min": -1.5,
+        "power_max": 3.1,
+        "snr_min": 38.6,
+        "snr_avg": 39.9,
+    }
+    assert summary["upstream"] == {
+        "channels": 1,
+        "power_min": 44.5,
+        "power_max": 44.5,
+        "snr_min": None,
+        "snr_avg": None,
+    }
+    assert (summary["corrected"], summary["uncorrectable"]) == (20.0, 3.0)
+
+
+def test_level_summary_of_empty_reply():
+    summary = level_summary({})
+    assert summary["downstream"]["channels"] == 0
+    assert summary["upstream"]["power_min"] is None
+    assert summary["corrected"] is None
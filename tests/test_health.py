@@ -0,0 +1,112 @@
+import pytest
+
+from health import HealthMonitor, parse_memory, parse_uptime
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("93784", 93784),
+        (93784, 93784),
+        ("1 days 02h:03m:04s", 93784),
+        ("1d 2h 3m 4s", 93784),
+        ("P1DT2H3M4S", 93784),
+        ("1 day, 02:03:04", 93784),
+        ("02:03:04", 7384),
+        ("0s", 0),
+        (None, None),
+        ("", None),
+        ("unknown", None),
+    ],
+)
+def test_parse_uptime(value, expected):
+    assert parse_uptime(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("123456", 123456.0),
+        ("123456 kB", 123456.0),
+        ("512 KiB", 512.0),
+        ("120 MB", 120 * 1024.0),
+        ("1.5 GiB", 1.5 * 1024 ** 2),
+        ("2048 B", 2.0),
+        (None, None),
+        ("n/a", None),
+    ],
+)
+def test_parse_memory(value, expected):
+    assert parse_memory(value) == expected
+
+
+def _system(uptime, free, total=100000):
+    return {"UpTime": str(uptime), "MemFree": str(free), "MemTotal": str(total)}
+
+
+def test_slope_of_linear_decline_is_exact():
+    monitor = HealthMonitor()
+    for minute in range(0, 121, 10):
+        monitor.update(_system(1000 + minute * 60, 80000 - 50 * minute), now=minute * 60.0)
+    # 50 KiB per minute
+    assert monitor.mem_free_slope == pytest.approx(-3000.0)
+    assert monitor.trend_span_hours == pytest.approx(2.0)
+    assert monitor.mem_used_pct == pytest.approx(100.0 * (100000 - 74000) / 100000)
+
+
+def test_window_slides_and_forgets_old_samples():
+    monitor = HealthMonitor(window=5)
+    # Flat for an hour, then rising at 600 KiB/h; only the last 5 samples count
+    for minute in range(0, 61, 10):
+        monitor.update(_system(minute * 60, 50000), now=minute * 60.0)
+    for minute in range(70, 121, 10):
+        monitor.update(_system(minute * 60, 50000 + 10 * (minute - 60)), now=minute * 60.0)
+    assert monitor._n == 5
+    assert monitor.mem_free_slope == pytest.approx(600.0)
+    assert monitor.trend_span_hours == pytest.approx(40 / 60)
+
+
+def test_leak_needs_span_and_rate():
+    monitor = HealthMonitor(min_span_hours=1.0, leak_pct_per_hour=1.0)
+    # 1.2% of total per hour
+    for minute in range(0, 50, 10):
+        monitor.update(_system(minute * 60, 90000 - 20 * minute), now=minute * 60.0)
+    assert monitor.mem_free_slope == pytest.approx(-1200.0)
+    assert not monitor.leak_suspected  # window shorter than an hour
+    for minute in range(50, 71, 10):
+        monitor.update(_system(minute * 60, 90000 - 20 * minute), now=minute * 60.0)
+    assert monitor.leak_suspected
+
+    slow = HealthMonitor()
+    for minute in range(0, 121, 10):
+        slow.update(_system(minute * 60, 90000 - 5 * minute), now=minute * 60.0)
+    assert not slow.leak_suspected  # 0.3% per hour
+
+
+def test_close_samples_and_repeated_replies_are_skipped():
+    monitor = HealthMonitor(min_sample_spacing=5.0)
+    reply = _system(100, 50000)
+    monitor.update(reply, now=0.0)
+    monitor.update(reply, now=60.0)
+    monitor.update(_system(101, 40000), now=1.0)
+    assert monitor._n == 1
+    assert monitor.mem_free_slope is None
+    assert monitor.mem_free == 40000
+
+
+def test_reboots_reset_trend_and_classify_expected():
+    monitor = HealthMonitor(expected_reboot_window=1800)
+    monitor.update(_system(5000, 60000), now=0.0)
+    monitor.update(_system(5600, 59000), now=600.0)
+    monitor.update(_system(30, 70000), now=1200.0)
+    assert (monitor.reboots, monitor.unexpected_reboots) == (1, 1)
+    assert monitor.last_reboot_expected is False
+    assert monitor.boot_time == 1170.0
+    assert monitor._n == 1
+
+    monitor.update(_system(20, 70000), now=1800.0, reboot_requested_at=1700.0)
+    assert (monitor.reboots, monitor.unexpected_reboots) == (2, 1)
+    assert monitor.last_reboot_expected is True
+
+    monitor.update(_system(10, 70000), now=9000.0, reboot_requested_at=1700.0)
+    assert (monitor.reboots, monitor.unexpected_reboots) == (3, 2)
@@ -0,0 +1,118 @@
+import ipaddress
+
+import hosts
+from hosts import HOSTNAME_CHANGED, IP_CHANGED, JOINED, LEFT, HostState, HostTable
+
+
+def _dev(mac, ip="", hostname="", active="true"):
+    return {"physaddress": mac, "ipaddress": ip, "hostname": hostname, "active": active}
+
+
+def _kinds(changes):
+    return sorted((change.kind, change.mac) for change in changes)
+
+
+def test_snapshot_normalizes_macs_and_presence():
+    table = [
+        _dev("AA-BB-CC-DD-EE-01", " 192.168.0.10 ", " laptop ", "true"),
+        _dev("aa:bb:cc:dd:ee:02", "192.168.0.11", "", "false"),
+        {"physaddress": "aa:bb:cc:dd:ee:03", "Active": "true"},
+        {"physaddress": "", "ipaddress": "192.168.0.99"},
+    ]
+    assert hosts.snapshot(table) == {
+        "aa:bb:cc:dd:ee:01": HostState("192.168.0.10", "laptop", True),
+        "aa:bb:cc:dd:ee:02": HostState("192.168.0.11", "", False),
+        "aa:bb:cc:dd:ee:03": HostState("", "", True),
+    }
+    assert hosts.snapshot(None) == {}
+
+
+def test_is_online_prefers_active_over_status():
+    assert hosts.is_online({"active": "false", "Status": "ONLINE"}) is False
+    assert hosts.is_online({"Active": True}) is True
+    assert hosts.is_online({"active": "maybe", "Status": "ONLINE"}) is True
+    assert hosts.is_online({"active": "maybe", "status": "offline"}) is False
+    assert hosts.is_online({}) is False
+
+
+def test_diff_join_and_leave():
+    previous = {
+        "01": HostState("192.168.0.1", "a", True),
+        "02": HostState("192.168.0.2", "b", False),
+        "03": HostState("192.168.0.3", "c", True),
+        "04": HostState("192.168.0.4", "d", True),
+        "05": HostState("192.168.0.5", "e", False),
+    }
+    current = {
+        "01": HostState("192.168.0.1", "a", True),   # unchanged
+        "02": HostState("192.168.0.2", "b", True),   # back online
+        "03": HostState("192.168.0.3", "c", False),  # went offline
+        "06": HostState("192.168.0.6", "f", True),   # new and online
+        "07": HostState("192.168.0.7", "g", False),  # new but offline
+    }
+    # 04 was online and vanished; 05 was offline and vanished (no event)
+    assert _kinds(hosts.diff(previous, current)) == [
+        (JOINED, "02"), (JOINED, "06"), (LEFT, "03"), (LEFT, "04"),
+    ]
+
+
+def test_diff_ip_and_hostname_changes():
+    previous = {"01": HostState("192.168.0.1", "old", True), "02": HostState("192.168.0.2", "x", True)}
+    current = {"01": HostState("192.168.0.9", "new", True), "02": HostState("", "", True)}
+    changes = hosts.diff(previous, current)
+    assert _kinds(changes) == [(HOSTNAME_CHANGED, "01"), (IP_CHANGED, "01")]
+    ip_change = next(change for change in changes if change.kind == IP_CHANGED)
+    assert (ip_change.previous.ip, ip_change.current.ip) == ("192.168.0.1", "192.168.0.9")
+
+
+def test_diff_of_identical_snapshots_is_empty():
+    state = {"01": HostState("192.168.0.1", "a", True)}
+    assert hosts.diff(state, dict(state)) == []
+    assert _kinds(hosts.diff({}, state)) == [(JOINED, "01")]
+    assert _kinds(hosts.diff(state, {})) == [(LEFT, "01")]
+
+
+def _table():
+    table = HostTable(vendor_of=lambda mac: "Acme" if mac.startswith("aa:") else None)
+    table.update([
+        _dev("aa:00:00:00:00:01", "192.168.0.20", "Zeta"),
+        _dev("aa:00:00:00:00:02", "192.168.0.3", "alpha", "false"),
+        _dev("bb:00:00:00:00:03", "192.168.1.5", ""),
+        _dev("bb:00:00:00:00:04", "", "beta"),
+    ], now=100.0)
+    return table
+
+
+def test_host_table_sorts_numerically_with_missing_values_last():
+    table = _table()
+    count, page = table.query(sort="ip")
+    assert count == 4
+    assert [row["ip"] for row in page] == ["192.168.0.3", "192.168.0.20", "192.168.1.5", ""]
+    _, page = table.query(sort="ip", descending=True)
+    assert [row["ip"] for row in page] == ["192.168.1.5", "192.168.0.20", "192.168.0.3", ""]
+    _, page = table.query(sort="hostname")
+    assert [row["hostname"] for row in page] == ["alpha", "beta", "Zeta", ""]
+
+
+def test_host_table_filters_and_pages():
+    table = _table()
+    count, page = table.query(online=True, offset=1, limit=1)
+    assert count == 3
+    assert [row["mac"] for row in page] == ["bb:00:00:00:00:03"]
+    count, page = table.query(subnet=ipaddress.ip_network("192.168.0.0/24"))
+    assert count == 2
+    count, page = table.query(mac_prefix="bb:00:")
+    assert {row["mac"] for row in page} == {"bb:00:00:00:00:03", "bb:00:00:00:00:04"}
+    assert page[0]["vendor"] is None
+    assert table.query(mac_prefix="aa:")[1][0]["vendor"] == "Acme"
+
+
+def test_host_table_keeps_last_seen_while_offline():
+    table = _table()
+    assert table.last_seen["aa:00:00:00:00:01"] == 100.0
+    assert "aa:00:00:00:00:02" not in table.last_seen
+    table.update([_dev("aa:00:00:00:00:01", "192.168.0.20", "Zeta", "false")], now=200.0)
+    assert table.rows[0]["last_seen"] == 100.0
+    assert set(table.last_seen) == {"aa:00:00:00:00:01"}
+    _, page = table.query(sort="last_seen")
+    assert page[0]["last_seen"] == 100.0
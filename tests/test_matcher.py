@@ -0,0 +1,99 @@
+import pytest
+
+from matcher import IPRuleSet, MACRuleSet, normalize_ip_rule, normalize_mac_rule
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("192.168.0.10", "192.168.0.10"),
+        (" 192.168.0.10 ", "192.168.0.10"),
+        ("192.168.50.7/24", "192.168.50.0/24"),
+        ("192.168.0.10/32", "192.168.0.10"),
+        ("fd00::1/64", "fd00::/64"),
+    ],
+)
+def test_normalize_ip_rule(text, expected):
+    assert normalize_ip_rule(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "192.168.0", "192.168.0.256", "192.168.0.0/33", "host.lan"])
+def test_normalize_ip_rule_rejects(text):
+    with pytest.raises(ValueError):
+        normalize_ip_rule(text)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("AA:BB:CC:DD:EE:FF", "aa:bb:cc:dd:ee:ff"),
+        ("aa-bb-cc-dd-ee-ff", "aa:bb:cc:dd:ee:ff"),
+        ("aabbccddeeff", "aa:bb:cc:dd:ee:ff"),
+        ("aabb.ccdd.eeff", "aa:bb:cc:dd:ee:ff"),
+        ("a:b:c:d:e:f", "0a:0b:0c:0d:0e:0f"),
+        ("aa:bb:cc:*", "aa:bb:cc:*"),
+        ("aa:bb:cc:*:*:*", "aa:bb:cc:*"),
+        ("AA-BB-CC", "aa:bb:cc:*"),
+        ("aabbcc*", "aa:bb:cc:*"),
+        ("aa.bb.cc", "aa:bb:cc:*"),
+        ("aabb.cc*", "aa:bb:cc:*"),
+    ],
+)
+def test_normalize_mac_rule(text, expected):
+    assert normalize_mac_rule(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "*", "aabbc", "gg:bb:cc", "aa:bb:cc:dd:ee:ff:00", "aab.ccdd.eeff", "aa:bb.ccdd"])
+def test_normalize_mac_rule_rejects(text):
+    with pytest.raises(ValueError):
+        normalize_mac_rule(text)
+
+
+def test_ip_rules_most_specific_wins():
+    rules = IPRuleSet({
+        "192.168.0.0/16": "site",
+        "192.168.50.0/24": "guest",
+        "192.168.50.10": "printer",
+        "fd00::/64": "v6",
+    })
+    assert len(rules) == 4
+    assert rules.get("192.168.50.10") == "printer"
+    assert rules.get("192.168.50.11") == "guest"
+    assert rules.get("192.168.51.1") == "site"
+    assert rules.get("192.168.255.255") == "site"
+    assert rules.get("10.0.0.1") is None
+    assert rules.get("fd00::1234") == "v6"
+    assert rules.get("fd01::1", "none") == "none"
+
+
+def test_ip_rules_ignore_invalid_addresses():
+    rules = IPRuleSet({"0.0.0.0/0": True})
+    assert "8.8.8.8" in rules
+    assert "not-an-ip" not in rules
+    assert "256.1.1.1" not in rules
+    assert rules.get(None) is None
+
+
+def test_ip_rules_network_boundaries():
+    rules = IPRuleSet({"10.0.0.0/30": "a", "10.0.0.4/30": "b"})
+    assert [rules.get(f"10.0.0.{n}") for n in range(9)] == ["a"] * 4 + ["b"] * 4 + [None]
+
+
+def test_mac_rules_longest_prefix_wins():
+    rules = MACRuleSet({
+        "aa:bb:cc:*": "vendor",
+        "aa:bb:*": "short",
+        "AA-BB-CC-DD-EE-FF": "device",
+    })
+    assert len(rules) == 3
+    assert rules.get("aa:bb:cc:dd:ee:ff") == "device"
+    assert rules.get("AA-BB-CC-00-00-01") == "vendor"
+    assert rules.get("aa:bb:00:00:00:01") == "short"
+    assert rules.get("00:bb:cc:dd:ee:ff") is None
+    assert "aa:bb:cc:11:22:33" in rules
+
+
+def test_mac_rules_same_rule_in_two_notations_counts_once():
+    rules = MACRuleSet({"aa:bb:cc:*": 1, "AABBCC": 2})
+    assert len(rules) == 1
+    assert rules.get("aa:bb:cc:00:00:00") == 2
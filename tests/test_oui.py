@@ -0,0 +1,77 @@
+import pytest
+
+import oui
+from build_oui import build
+from oui import OUIIndex, is_randomized
+
+ROWS = [
+    ("00-00-0C", "Cisco Systems, Inc"),
+    ("00:1A:11", "Google, Inc."),
+    ("3C5A B4", "ignored: malformed"),
+    ("F4F5D8", "Google, Inc."),
+    ("FCFFAA", "Last   Vendor  "),
+    ("001A12", ""),
+]
+
+
+@pytest.fixture(scope="module")
+def index():
+    return OUIIndex(build(ROWS))
+
+
+def test_build_skips_malformed_rows_and_deduplicates_vendors(index):
+    magic, count, vendors = oui.HEADER.unpack_from(build(ROWS), 0)
+    assert (magic, count, vendors) == (oui.MAGIC, 4, 3)
+    assert len(index) == 4
+
+
+@pytest.mark.parametrize(
+    "mac, expected",
+    [
+        ("00:00:0c:12:34:56", "Cisco Systems, Inc"),
+        ("00-1A-11-00-00-01", "Google, Inc."),
+        ("001a.1100.0001", "Google, Inc."),
+        ("f4f5d8aabbcc", "Google, Inc."),
+        ("fc:ff:aa:00:00:00", "Last Vendor"),
+    ],
+)
+def test_lookup_hits(index, mac, expected):
+    assert index.vendor(mac) == expected
+
+
+@pytest.mark.parametrize(
+    "mac",
+    [
+        "00:00:0b:00:00:00",  # before the first key
+        "00:1a:12:00:00:00",  # between keys (and dropped for its empty name)
+        "ff:ff:ff:ff:ff:ff",  # after the last key
+        "00:1a",
+        "zz:zz:zz:00:00:00",
+        "",
+        None,
+    ],
+)
+def test_lookup_misses(index, mac):
+    assert index.vendor(mac) is None
+
+
+def test_rejects_other_blobs():
+    with pytest.raises(ValueError):
+        OUIIndex(b"NOPE" + bytes(8))
+
+
+def test_is_randomized():
+    assert is_randomized("da:a1:19:00:00:01")
+    assert is_randomized("02-00-00-00-00-00")
+    assert not is_randomized("00:00:0c:12:34:56")
+    assert not is_randomized("")
+
+
+def test_bundled_index_loads():
+    index = oui.load()
+    assert index is not None
+    assert len(index) > 10000
+    keys = index._keys
+    assert all(keys[i] < keys[i + 1] for i in range(0, len(keys) - 1, 97))
+    assert oui.vendor("00:00:0c:00:00:00")
+    assert oui.vendor("02:00:0c:00:00:00") is None
@@ -0,0 +1,80 @@
+import ipaddress
+from datetime import datetime, timezone
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import ATTR_CONFIG_ENTRY_ID, DATA_HOST_TABLES, WS_MAX_LIMIT, WS_TYPE_HOSTS
+from .hosts import SORT_KEYS
+from .matcher import normalize_mac_rule
+
+
+def _iso(epoch: float | None) -> str | None:
+    return None if epoch is None else datetime.fromtimestamp(epoch, timezone.utc).isoformat(timespec="seconds")
+
+
+@websocket_api.websocket_command({
+    vol.Required("type"): WS_TYPE_HOSTS,
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): str,
+    vol.Optional("offset", default=0): vol.All(int, vol.Range(min=0)),
+    vol.Optional("limit", default=50): vol.All(int, vol.Range(min=1, max=WS_MAX_LIMIT)),
+    vol.Optional("sort", default="ip"): vol.In(SORT_KEYS),
+    vol.Optional("descending", default=False): bool,
+    vol.Optional("online"): bool,
+    vol.Optional("subnet"): str,
+    vol.Optional("mac_prefix"): str,
+})
+@callback
+def ws_hosts(hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict):
+    """One page of the cached host table; never contacts the gateway."""
+    tables = hass.data.get(DATA_HOST_TABLES, {})
+    entry_id = msg.get(ATTR_CONFIG_ENTRY_ID)
+    if entry_id is None:
+        if len(tables) != 1:
+            connection.send_error(
+                msg["id"], websocket_api.ERR_INVALID_FORMAT,
+                f"{ATTR_CONFIG_ENTRY_ID} is required when {len(tables)} gateways are configured",
+            )
+            return
+        entry_id = next(iter(tables))
+    table = tables.get(entry_id)
+    if table is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "No host table for this gateway")
+        return
+
+    subnet = mac_prefix = None
+    try:
+        if "subnet" in msg:
+            subnet = ipaddress.ip_network(msg["subnet"].strip(), strict=False)
+        if "mac_prefix" in msg:
+            # "aa:bb:cc:*" -> "aa:bb:cc:"; a full address stays an exact match
+            mac_prefix = normalize_mac_rule(msg["mac_prefix"]).rstrip("*")
+    except ValueError as err:
+        connection.send_error(msg["id"], websocket_api.ERR_INVALID_FORMAT, str(err))
+        return
+
+    total, rows = table.query(
+        sort=msg["sort"],
+        descending=msg["descending"],
+        offset=msg["offset"],
+        limit=msg["limit"],
+        online=msg.get("online"),
+        subnet=subnet,
+        mac_prefix=mac_prefix,
+    )
+    connection.send_result(msg["id"], {
+        "config_entry_id": entry_id,
+        "updated": _iso(table.updated),
+        "total": total,
+        "offset": msg["offset"],
+        "limit": msg["limit"],
+        "hosts": [{**row, "last_seen": _iso(row["last_seen"])} for row in rows],
+    })
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant):
+    """Register the websocket commands (safe to call for every config entry)."""
+    websocket_api.async_register_command(hass, ws_hosts)